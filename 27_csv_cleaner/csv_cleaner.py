@@ -38,9 +38,18 @@ Output Format:
 
 import csv
 import argparse
+import codecs
 import sys
 
 
+# Whitespace removed by str.strip() for ASCII text, so the byte-level fast path
+# strips exactly the same characters as clean_field_value
+ASCII_WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+
+# Encodings in which ASCII bytes decode to the same characters
+ASCII_COMPATIBLE_ENCODINGS = {'ascii', 'utf-8', 'latin-1', 'iso8859-1', 'cp1252'}
+
+
 def clean_field_value(value):
     """
     Clean a single CSV field value by removing leading/trailing whitespace.
@@ -57,19 +66,6 @@ def clean_field_value(value):
     return str(value).strip()
 
 
-def is_empty_row(row):
-    """
-    Check if a row is completely empty after cleaning.
-
-    Args:
-        row: Dictionary representing a CSV row
-
-    Returns:
-        True if all fields are empty strings after stripping
-    """
-    return all(str(v).strip() == '' for v in row.values())
-
-
 def read_csv_with_headers(file_path, encoding='utf-8'):
     """
     Read CSV file with headers.
@@ -79,7 +75,8 @@ def read_csv_with_headers(file_path, encoding='utf-8'):
         encoding: File encoding (default: utf-8)
 
     Returns:
-        Tuple of (list of rows as dicts, list of header field names)
+        Tuple of (list of rows as lists of values in header order,
+        list of header field names)
 
     Raises:
         SystemExit on file not found or CSV parsing errors
@@ -88,16 +85,26 @@ def read_csv_with_headers(file_path, encoding='utf-8'):
         print(f"📄 Reading CSV file: {file_path}...")
 
         with open(file_path, 'r', newline='', encoding=encoding) as f:
-            reader = csv.DictReader(f)
+            # Rows are kept as plain lists aligned with the header instead of
+            # one dict per row, which dominated memory on large files
+            reader = csv.reader(f)
 
             # Get headers
-            headers = reader.fieldnames
+            headers = next(reader, None)
             if not headers:
                 print("❌ Error: CSV file has no headers")
                 sys.exit(1)
 
-            # Read all rows
-            rows = list(reader)
+            # Read all rows, skipping blank lines and fitting each row to the
+            # header width (short rows padded, extra trailing fields dropped)
+            width = len(headers)
+            rows = []
+            for row in reader:
+                if not row:
+                    continue
+                if len(row) != width:
+                    row = row[:width] + [''] * (width - len(row))
+                rows.append(row)
 
         print(f"✅ Loaded {len(rows)} rows (+ 1 header row)")
         return rows, headers
@@ -122,7 +129,7 @@ def write_cleaned_csv(cleaned_rows, output_path, headers, encoding='utf-8'):
     Write cleaned CSV data to file.
 
     Args:
-        cleaned_rows: List of cleaned row dictionaries
+        cleaned_rows: List of cleaned rows (lists of values in header order)
         output_path: Path to output CSV file
         headers: List of header field names
         encoding: File encoding (default: utf-8)
@@ -139,11 +146,8 @@ def write_cleaned_csv(cleaned_rows, output_path, headers, encoding='utf-8'):
             # Write header
             writer.writerow(headers)
 
-            # Write data rows
-            for row in cleaned_rows:
-                # Convert dict to list in header order
-                row_values = [row.get(h, '') for h in headers]
-                writer.writerow(row_values)
+            # Write data rows (already in header order)
+            writer.writerows(cleaned_rows)
 
         print(f"✅ Successfully wrote {len(cleaned_rows)} rows")
 
@@ -155,6 +159,94 @@ def write_cleaned_csv(cleaned_rows, output_path, headers, encoding='utf-8'):
         sys.exit(1)
 
 
+def clean_ascii_csv(input_path, output_path, encoding='utf-8'):
+    """
+    Clean a plain ASCII CSV directly on bytes, skipping the Unicode codec.
+
+    Only used when the whole file is ASCII and contains no quote characters,
+    so splitting on commas and newlines gives exactly the fields csv.reader
+    would produce.
+
+    Args:
+        input_path: Path to input CSV file
+        output_path: Path to output CSV file
+        encoding: Encoding requested for the file
+
+    Returns:
+        Tuple of (input rows, output rows, empty rows removed, fields cleaned),
+        or None if the file does not qualify and the regular path must be used
+    """
+    try:
+        if codecs.lookup(encoding).name not in ASCII_COMPATIBLE_ENCODINGS:
+            return None
+        with open(input_path, 'rb') as f:
+            data = f.read()
+    except (LookupError, OSError):
+        # Let the regular path report the problem
+        return None
+
+    if not data.isascii() or b'"' in data:
+        return None
+
+    lines = data.splitlines()
+    if not lines or not lines[0]:
+        return None
+
+    print(f"📄 Reading CSV file: {input_path}...")
+    print("⚡ Plain ASCII file without quoted fields: cleaning at byte level")
+
+    header = lines[0]
+    width = header.count(b',') + 1
+    output_lines = [header]
+    input_count = 0
+    empty_rows_removed = 0
+    total_fields_cleaned = 0
+
+    for line in lines[1:]:
+        if not line:
+            # Blank line (csv.reader skips these too)
+            continue
+        input_count += 1
+
+        fields = line.split(b',')
+        if len(fields) != width:
+            fields = fields[:width] + [b''] * (width - len(fields))
+        cleaned = [field.strip(ASCII_WHITESPACE) for field in fields]
+        total_fields_cleaned += width
+
+        if not any(cleaned):
+            empty_rows_removed += 1
+            continue
+
+        output_lines.append(b','.join(cleaned))
+
+    print(f"\n💾 Writing cleaned CSV to: {output_path}...")
+    try:
+        with open(output_path, 'wb') as f:
+            # csv.writer terminates rows with \r\n
+            f.write(b'\r\n'.join(output_lines) + b'\r\n')
+    except PermissionError:
+        print(f"❌ Error: Permission denied writing to '{output_path}'")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error writing output file: {e}")
+        sys.exit(1)
+
+    output_count = len(output_lines) - 1
+    print(f"✅ Successfully wrote {output_count} rows")
+    return input_count, output_count, empty_rows_removed, total_fields_cleaned
+
+
+def print_statistics(input_count, output_count, empty_rows_removed, total_fields_cleaned):
+    """Print the cleaning summary."""
+    print(f"\n📊 Cleaning Statistics:")
+    print(f"  Input rows (excluding headers):  {input_count}")
+    print(f"  Output rows:                     {output_count}")
+    print(f"  Empty rows removed:              {empty_rows_removed}")
+    print(f"  Fields cleaned:                  {total_fields_cleaned}")
+    print(f"\n✅ CSV cleaning completed successfully!")
+
+
 def main():
     """Main function to handle command-line arguments and orchestrate CSV cleaning."""
 
@@ -181,6 +273,12 @@ This script cleans CSV files by:
 
     args = parser.parse_args()
 
+    # Fast path: plain ASCII files without quoting are cleaned as bytes
+    stats = clean_ascii_csv(args.input_file, args.output_file, args.encoding)
+    if stats is not None:
+        print_statistics(*stats)
+        return
+
     # Read CSV file
     rows, headers = read_csv_with_headers(args.input_file, args.encoding)
 
@@ -196,11 +294,11 @@ This script cleans CSV files by:
 
     for row in rows:
         # Clean all field values
-        cleaned_row = {k: clean_field_value(v) for k, v in row.items()}
+        cleaned_row = [clean_field_value(v) for v in row]
         total_fields_cleaned += len(cleaned_row)
 
-        # Skip completely empty rows
-        if is_empty_row(cleaned_row):
+        # Skip completely empty rows (values are already stripped strings)
+        if not any(cleaned_row):
             empty_rows_removed += 1
             continue
 
@@ -210,16 +308,7 @@ This script cleans CSV files by:
     write_cleaned_csv(cleaned_rows, args.output_file, headers, args.encoding)
 
     # Print statistics
-    input_count = len(rows)
-    output_count = len(cleaned_rows)
-
-    print(f"\n📊 Cleaning Statistics:")
-    print(f"  Input rows (excluding headers):  {input_count}")
-    print(f"  Output rows:                     {output_count}")
-    print(f"  Empty rows removed:              {empty_rows_removed}")
-    print(f"  Fields cleaned:                  {total_fields_cleaned}")
-    print(f"\n✅ CSV cleaning completed successfully!")
-
+    print_statistics(len(rows), len(cleaned_rows), empty_rows_removed, total_fields_cleaned)
 
 if __name__ == '__main__':
     main()
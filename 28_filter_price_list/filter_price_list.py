@@ -28,10 +28,32 @@ Output:
 
 import json
 import csv
+import itertools
+import re
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Output files are written through a 1 MiB buffer to cut write() syscalls
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Price rows sampled to rank candidate price columns by how often they are filled
+PRICE_SAMPLE_ROWS = 1000
+
 
 def _clean_fieldnames(fieldnames):
     """Remove empty/None headers that can appear in malformed CSVs."""
@@ -40,54 +62,81 @@ def _clean_fieldnames(fieldnames):
     return [fn for fn in fieldnames if fn is not None and str(fn).strip() != '']
 
 
-def _sanitize_row(row):
-    """Drop DictReader's extra-fields bucket (key None) to avoid DictWriter errors."""
-    if row is None:
-        return row
-    if None in row:
-        # DictReader stores extra columns (beyond header count) under key None
-        row.pop(None, None)
-    return row
+# Digits and separators with an optional sign and exponent, e.g. "1234",
+# "1.234,56", "1,234.56", "-12,5", "+5", ".5", "1e5"; anything else is
+# rejected before float(). Unlike float(), "inf", "nan" and "1_000" are not
+# prices.
+_NUM_RE = re.compile(r'^[-+]?[\d.,]*(?:[eE][-+]?\d+)?$')
+
+# "1.234,56" -> "1234.56" (comma is the decimal separator)
+_COMMA_DECIMAL = str.maketrans({'.': None, ',': '.'})
+# "1,234.56" -> "1234.56" (dot is the decimal separator)
+_DOT_DECIMAL = str.maketrans({',': None})
+
+
+def _to_number(v):
+    """Parse a price cell into a float, or None if it is empty or not numeric."""
+    if v is None:
+        return None
+    s = str(v).strip().replace(' ', '')
+    if not s or not _NUM_RE.match(s):
+        return None
+    # With both separators the first one to appear is the thousands one;
+    # a lone comma is the decimal separator
+    if ',' in s:
+        if '.' in s and s.find(',') < s.find('.'):
+            s = s.translate(_DOT_DECIMAL)
+        else:
+            s = s.translate(_COMMA_DECIMAL)
+    try:
+        return float(s)
+    except ValueError:
+        # Repeated separators of a single kind ("1.234.567") stay ambiguous
+        return None
 
 
-def _is_missing_price(row, candidate_fields):
-    """Return True if the row has no usable price value in any candidate field."""
-    if not row or not candidate_fields:
+def _is_missing_price(row, price_idxs):
+    """Return True if the row has no usable price value in any candidate column."""
+    if not row or not price_idxs:
         return False
 
-    def _to_number(v):
-        if v is None:
-            return None
-        s = str(v).strip()
-        if s == '':
-            return None
-        # Normalize common formats: "1.234,56" or "1,234.56"
-        s = s.replace(' ', '')
-        if ',' in s and '.' in s:
-            # Assume thousands separator is the first one that appears earlier
-            if s.find('.') < s.find(','):
-                # "1.234,56" -> "1234.56"
-                s = s.replace('.', '').replace(',', '.')
-            else:
-                # "1,234.56" -> "1234.56"
-                s = s.replace(',', '')
-        else:
-            # If only comma, treat as decimal separator
-            if ',' in s and '.' not in s:
-                s = s.replace(',', '.')
-        try:
-            return float(s)
-        except Exception:
-            return None
-
-    for field in candidate_fields:
-        if field in row:
-            n = _to_number(row.get(field))
-            if n is not None and n > 0:
-                return False
+    for idx in price_idxs:
+        n = _to_number(row[idx])
+        if n is not None and n > 0:
+            return False
     return True
 
 
+def _pct(count, total):
+    """Percentage of count over total, 0.0 when total is zero."""
+    return count / total * 100 if total else 0.0
+
+
+def _write_csv(path, fieldnames, rows, use_arrow=False):
+    """Write a header plus positional rows through a large output buffer."""
+    if use_arrow:
+        _write_csv_arrow(path, fieldnames, rows)
+        return
+    with open(path, 'w', encoding='utf-8', newline='', buffering=OUTPUT_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
+
+
+def _write_csv_arrow(path, fieldnames, rows):
+    """Write positional rows with pyarrow's C++ CSV writer (quotes every value)."""
+    columns = list(zip(*rows)) or [()] * len(fieldnames)
+    arrays = []
+    for column in columns:
+        try:
+            arrays.append(pa.array(column, type=pa.string()))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # JSON sources can carry numbers/booleans; write them as csv.writer would
+            arrays.append(pa.array([None if v is None else str(v) for v in column], type=pa.string()))
+    table = pa.Table.from_arrays(arrays, names=list(fieldnames))
+    pa_csv.write_csv(table, path, write_options=pa_csv.WriteOptions(eol='\r\n'))
+
+
 def load_vtex_data(file_path):
     """
     Load VTEX SKU data from CSV or JSON file.
@@ -103,27 +152,30 @@ def load_vtex_data(file_path):
 
     # Determine file type by extension
     if file_path.lower().endswith('.json'):
-        # Load from JSON
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-            # Handle both list and dict formats
-            if isinstance(data, list):
-                if data:
-                    fieldnames = list(data[0].keys())
-                for item in data:
-                    if '_SKUReferenceCode' in item:
-                        sku_id = str(item['_SKUReferenceCode']).strip()
-                        if sku_id:
-                            vtex_data[sku_id] = item
-            elif isinstance(data, dict):
-                for item in data.values():
-                    if isinstance(item, dict) and '_SKUReferenceCode' in item:
-                        if not fieldnames and item:
-                            fieldnames = list(item.keys())
-                        sku_id = str(item['_SKUReferenceCode']).strip()
-                        if sku_id:
-                            vtex_data[sku_id] = item
+        # Load from JSON (orjson is much faster on large catalogs when installed)
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+        # Handle both list and dict formats
+        if isinstance(data, list):
+            if data:
+                fieldnames = list(data[0].keys())
+            items = [item for item in data if '_SKUReferenceCode' in item]
+        elif isinstance(data, dict):
+            items = [item for item in data.values()
+                     if isinstance(item, dict) and '_SKUReferenceCode' in item]
+            if items:
+                fieldnames = list(items[0].keys())
+        else:
+            items = []
+
+        # Build the index in one pass instead of growing it item by item
+        pairs = ((str(item['_SKUReferenceCode']).strip(), item) for item in items)
+        vtex_data = {sku_id: item for sku_id, item in pairs if sku_id}
 
     else:
         # Load from CSV
@@ -137,17 +189,15 @@ def load_vtex_data(file_path):
                 print(f"Available fields: {', '.join(fieldnames)}")
                 sys.exit(1)
 
-            for row in reader:
-                sku_id = str(row['_SKUReferenceCode']).strip()
-                if sku_id:
-                    vtex_data[sku_id] = row
+            pairs = ((str(row['_SKUReferenceCode']).strip(), row) for row in reader)
+            vtex_data = {sku_id: row for sku_id, row in pairs if sku_id}
 
     fieldnames = _clean_fieldnames(fieldnames)
 
     return vtex_data, fieldnames
 
 
-def filter_price_list(vtex_file, price_file, output_prefix):
+def filter_price_list(vtex_file, price_file, output_prefix, arrow_writer=False):
     """
     Filter price list and generate multiple output files.
 
@@ -155,6 +205,7 @@ def filter_price_list(vtex_file, price_file, output_prefix):
         vtex_file: Path to VTEX products file (CSV or JSON)
         price_file: Path to price list CSV
         output_prefix: Prefix for output files
+        arrow_writer: Write the output CSVs with pyarrow instead of csv.writer
     """
     print(f"Cargando datos de SKU VTEX desde: {vtex_file}")
     vtex_data, vtex_fieldnames = load_vtex_data(vtex_file)
@@ -169,8 +220,9 @@ def filter_price_list(vtex_file, price_file, output_prefix):
 
     # Read price list
     with open(price_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        price_fieldnames = _clean_fieldnames(reader.fieldnames)
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        price_fieldnames = _clean_fieldnames(header)
 
         if not price_fieldnames:
             print(f"Error: Could not detect headers in {price_file}. Is the file empty or missing a header row?")
@@ -182,6 +234,12 @@ def filter_price_list(vtex_file, price_file, output_prefix):
             print(f"Available fields: {', '.join(price_fieldnames)}")
             sys.exit(1)
 
+        # Rows are kept positionally, projected onto the non-empty header
+        # columns, so each column name maps to a fixed index in every row
+        keep_idxs = [i for i, fn in enumerate(header) if fn is not None and str(fn).strip() != '']
+        field_idx = {fn: i for i, fn in enumerate(price_fieldnames)}
+        codigo_idx = field_idx['código producto']
+
         # Heuristic: detect possible price columns in the price list
         lowered = {fn.lower(): fn for fn in price_fieldnames}
         preferred = [
@@ -196,21 +254,58 @@ def filter_price_list(vtex_file, price_file, output_prefix):
                 lfn = fn.lower()
                 if 'precio' in lfn or 'price' in lfn:
                     candidate_price_fields.append(fn)
+        price_idxs = [field_idx[fn] for fn in candidate_price_fields]
+
+        # Check the most populated price column first: a sample of rows decides
+        # the order, and _is_missing_price stops at the first positive price
+        sample = list(itertools.islice(reader, PRICE_SAMPLE_ROWS))
+        if len(price_idxs) > 1:
+            filled = {
+                idx: sum(1 for raw in sample
+                         if keep_idxs[idx] < len(raw) and raw[keep_idxs[idx]].strip())
+                for idx in price_idxs
+            }
+            price_idxs.sort(key=lambda idx: filled[idx], reverse=True)
+        price_idxs = tuple(price_idxs)
+
+        # Membership only needs the keys; a keys-only frozenset is a smaller
+        # table than the row dict and skips fetching the value slot
+        vtex_keys = frozenset(vtex_data)
+
+        # Bind hot-loop lookups to locals once instead of resolving them per row
+        is_vtex_sku = vtex_keys.__contains__
+        add_matched = matched_prices.append
+        add_unmatched = unmatched_prices.append
+        add_found = found_sku_ids.add
+        add_missing_price = matched_without_price.append
+
+        # Well-formed rows of a header without unnamed columns are already in
+        # output shape; only ragged rows need to be projected
+        header_width = len(header)
+        needs_projection = len(keep_idxs) != header_width
 
         # Filter rows
-        for row in reader:
-            row = _sanitize_row(row)
-            codigo = str(row['código producto']).strip()
+        for raw in itertools.chain(sample, reader):
+            if not raw:
+                # Blank line (DictReader used to skip these too)
+                continue
+            width = len(raw)
+            if width == header_width and not needs_projection:
+                row = raw
+            else:
+                # Pad short rows and drop extra/unnamed columns
+                row = [raw[i] if i < width else '' for i in keep_idxs]
+            codigo = row[codigo_idx].strip()
 
-            if codigo in vtex_data:
-                matched_prices.append(row)
-                found_sku_ids.add(codigo)
+            if is_vtex_sku(codigo):
+                add_matched(row)
+                add_found(codigo)
 
                 # Also capture SKUs found but missing/empty price
-                if _is_missing_price(row, candidate_price_fields):
-                    matched_without_price.append(row)
+                if _is_missing_price(row, price_idxs):
+                    add_missing_price(row)
             else:
-                unmatched_prices.append(row)
+                add_unmatched(row)
 
     # Find VTEX SKUs without prices
     vtex_without_price = []
@@ -225,34 +320,6 @@ def filter_price_list(vtex_file, price_file, output_prefix):
     prices_no_sku_file = f"{output_prefix}_prices_without_sku.csv"
     report_file = f"{output_prefix}_REPORT.md"
 
-    # Write matched prices
-    print(f"\nEscribiendo precios coincidentes en: {matched_file}")
-    with open(matched_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=price_fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(matched_prices)
-
-    # Write matched SKUs but with missing/empty price
-    print(f"Escribiendo SKUs encontrados pero sin precio en: {matched_missing_price_file}")
-    with open(matched_missing_price_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=price_fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(matched_without_price)
-
-    # Write VTEX SKUs without prices
-    print(f"Escribiendo SKUs de VTEX sin precios en: {vtex_no_price_file}")
-    with open(vtex_no_price_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=_clean_fieldnames(vtex_fieldnames), extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(vtex_without_price)
-
-    # Write prices without VTEX SKUs
-    print(f"Escribiendo precios sin SKUs de VTEX en: {prices_no_sku_file}")
-    with open(prices_no_sku_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=price_fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        writer.writerows(unmatched_prices)
-
     # Calculate statistics
     total_vtex = len(vtex_data)
     total_prices = len(matched_prices) + len(unmatched_prices)
@@ -261,23 +328,47 @@ def filter_price_list(vtex_file, price_file, output_prefix):
     vtex_no_price_count = len(vtex_without_price)
     prices_no_sku_count = len(unmatched_prices)
 
-    # Generate report
+    vtex_out_fields = _clean_fieldnames(vtex_fieldnames)
+
+    # The outputs are independent, so write them concurrently; file writes
+    # release the GIL and overlap instead of running back to back
+    print(f"\nEscribiendo precios coincidentes en: {matched_file}")
+    print(f"Escribiendo SKUs encontrados pero sin precio en: {matched_missing_price_file}")
+    print(f"Escribiendo SKUs de VTEX sin precios en: {vtex_no_price_file}")
+    print(f"Escribiendo precios sin SKUs de VTEX en: {prices_no_sku_file}")
     print(f"Generando reporte: {report_file}")
-    generate_report(
-        report_file,
-        vtex_file,
-        price_file,
-        total_vtex,
-        total_prices,
-        matched_count,
-        matched_missing_price_count,
-        vtex_no_price_count,
-        prices_no_sku_count,
-        matched_file,
-        matched_missing_price_file,
-        vtex_no_price_file,
-        prices_no_sku_file
-    )
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [
+            executor.submit(_write_csv, matched_file, price_fieldnames, matched_prices, arrow_writer),
+            executor.submit(_write_csv, matched_missing_price_file, price_fieldnames, matched_without_price, arrow_writer),
+            executor.submit(
+                _write_csv,
+                vtex_no_price_file,
+                vtex_out_fields,
+                ([item.get(fn) for fn in vtex_out_fields] for item in vtex_without_price),
+                arrow_writer
+            ),
+            executor.submit(_write_csv, prices_no_sku_file, price_fieldnames, unmatched_prices, arrow_writer),
+            executor.submit(
+                generate_report,
+                report_file,
+                vtex_file,
+                price_file,
+                total_vtex,
+                total_prices,
+                matched_count,
+                matched_missing_price_count,
+                vtex_no_price_count,
+                prices_no_sku_count,
+                matched_file,
+                matched_missing_price_file,
+                vtex_no_price_file,
+                prices_no_sku_file
+            ),
+        ]
+        # Surface any write error from the workers
+        for future in futures:
+            future.result()
 
     # Print statistics
     print(f"\n{'='*70}")
@@ -285,13 +376,13 @@ def filter_price_list(vtex_file, price_file, output_prefix):
     print(f"{'='*70}")
     print(f"SKUs VTEX:")
     print(f"  Total en VTEX:               {total_vtex}")
-    print(f"  Con precios (coincidentes):  {matched_count} ({matched_count/total_vtex*100:.1f}%)")
-    print(f"  Encontrados pero sin precio: {matched_missing_price_count} ({matched_missing_price_count/total_vtex*100:.1f}%)")
-    print(f"  Sin precios:                 {vtex_no_price_count} ({vtex_no_price_count/total_vtex*100:.1f}%)")
+    print(f"  Con precios (coincidentes):  {matched_count} ({_pct(matched_count, total_vtex):.1f}%)")
+    print(f"  Encontrados pero sin precio: {matched_missing_price_count} ({_pct(matched_missing_price_count, total_vtex):.1f}%)")
+    print(f"  Sin precios:                 {vtex_no_price_count} ({_pct(vtex_no_price_count, total_vtex):.1f}%)")
     print(f"\nLista de Precios:")
     print(f"  Total de precios:            {total_prices}")
-    print(f"  Con SKU VTEX (coincidentes): {matched_count} ({matched_count/total_prices*100:.1f}%)")
-    print(f"  Sin SKU VTEX:                {prices_no_sku_count} ({prices_no_sku_count/total_prices*100:.1f}%)")
+    print(f"  Con SKU VTEX (coincidentes): {matched_count} ({_pct(matched_count, total_prices):.1f}%)")
+    print(f"  Sin SKU VTEX:                {prices_no_sku_count} ({_pct(prices_no_sku_count, total_prices):.1f}%)")
     print(f"{'='*70}")
     print(f"\nArchivos de Salida Generados:")
     print(f"  1. {matched_file}")
@@ -302,15 +393,7 @@ def filter_price_list(vtex_file, price_file, output_prefix):
     print(f"{'='*70}")
 
 
-def generate_report(report_file, vtex_file, price_file, total_vtex, total_prices,
-                    matched_count, matched_missing_price_count, vtex_no_price_count, prices_no_sku_count,
-                    matched_file, matched_missing_price_file, vtex_no_price_file, prices_no_sku_file):
-    """
-    Generate a detailed markdown report.
-    """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    report = f"""# Reporte de Filtrado de Lista de Precios VTEX
+_REPORT_TMPL = """# Reporte de Filtrado de Lista de Precios VTEX
 
 **Generado:** {timestamp}
 
@@ -326,17 +409,17 @@ def generate_report(report_file, vtex_file, price_file, total_vtex, total_prices
 | Métrica | Cantidad | Porcentaje |
 |---------|----------|------------|
 | Total de SKUs VTEX | {total_vtex} | 100.0% |
-| SKUs con precios (coincidentes) | {matched_count} | {matched_count/total_vtex*100:.1f}% |
-| SKUs encontrados pero sin precio | {matched_missing_price_count} | {matched_missing_price_count/total_vtex*100:.1f}% |
-| SKUs sin precios | {vtex_no_price_count} | {vtex_no_price_count/total_vtex*100:.1f}% |
+| SKUs con precios (coincidentes) | {matched_count} | {matched_vtex_pct:.1f}% |
+| SKUs encontrados pero sin precio | {matched_missing_price_count} | {matched_missing_price_pct:.1f}% |
+| SKUs sin precios | {vtex_no_price_count} | {vtex_no_price_pct:.1f}% |
 
 ### Análisis de Lista de Precios
 
 | Métrica | Cantidad | Porcentaje |
 |---------|----------|------------|
 | Total de entradas de precios | {total_prices} | 100.0% |
-| Precios con SKU VTEX (coincidentes) | {matched_count} | {matched_count/total_prices*100:.1f}% |
-| Precios sin SKU VTEX | {prices_no_sku_count} | {prices_no_sku_count/total_prices*100:.1f}% |
+| Precios con SKU VTEX (coincidentes) | {matched_count} | {matched_prices_pct:.1f}% |
+| Precios sin SKU VTEX | {prices_no_sku_count} | {prices_no_sku_pct:.1f}% |
 
 ## Archivos de Salida
 
@@ -396,8 +479,36 @@ Estos son precios para productos que aún no existen en VTEX. Acción requerida:
 *Generado por Filtro de Lista de Precios VTEX*
 """
 
+
+def generate_report(report_file, vtex_file, price_file, total_vtex, total_prices,
+                    matched_count, matched_missing_price_count, vtex_no_price_count, prices_no_sku_count,
+                    matched_file, matched_missing_price_file, vtex_no_price_file, prices_no_sku_file):
+    """
+    Generate a detailed markdown report.
+    """
+    ctx = {
+        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'vtex_file': vtex_file,
+        'price_file': price_file,
+        'total_vtex': total_vtex,
+        'total_prices': total_prices,
+        'matched_count': matched_count,
+        'matched_missing_price_count': matched_missing_price_count,
+        'vtex_no_price_count': vtex_no_price_count,
+        'prices_no_sku_count': prices_no_sku_count,
+        'matched_file': matched_file,
+        'matched_missing_price_file': matched_missing_price_file,
+        'vtex_no_price_file': vtex_no_price_file,
+        'prices_no_sku_file': prices_no_sku_file,
+        'matched_vtex_pct': _pct(matched_count, total_vtex),
+        'matched_missing_price_pct': _pct(matched_missing_price_count, total_vtex),
+        'vtex_no_price_pct': _pct(vtex_no_price_count, total_vtex),
+        'matched_prices_pct': _pct(matched_count, total_prices),
+        'prices_no_sku_pct': _pct(prices_no_sku_count, total_prices),
+    }
+
     with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(report)
+        f.write(_REPORT_TMPL.format_map(ctx))
 
 
 def main():
@@ -419,12 +530,17 @@ Input Requirements:
   - VTEX file must have "_SKUReferenceCode" field
   - Price list must have "código producto" field
   - Both files must be UTF-8 encoded
+
+Optional:
+  --arrow-writer: write output CSVs with pyarrow (pip install pyarrow)
         '''
     )
 
     parser.add_argument('vtex_file', help='VTEX products file (CSV or JSON)')
     parser.add_argument('price_file', help='Price list CSV file')
     parser.add_argument('output_prefix', help='Prefix for output files')
+    parser.add_argument('--arrow-writer', action='store_true',
+                        help='Write output CSVs with pyarrow (requires: pip install pyarrow)')
 
     args = parser.parse_args()
 
@@ -438,8 +554,12 @@ Input Requirements:
         print(f"Error: Price list file not found: {args.price_file}")
         sys.exit(1)
 
+    if args.arrow_writer and not PYARROW_AVAILABLE:
+        print("Error: --arrow-writer requires pyarrow. Install it with: pip install pyarrow")
+        sys.exit(1)
+
     # Run filter
-    filter_price_list(args.vtex_file, args.price_file, args.output_prefix)
+    filter_price_list(args.vtex_file, args.price_file, args.output_prefix, args.arrow_writer)
 
 
 if __name__ == '__main__':
@@ -41,50 +41,134 @@ Notes:
     - Match is exact string match with preserved leading zeros
 """
 
+import io
 import json
 import csv
+import mmap
+import os
+import pickle
+import re
 import sys
+import shutil
 import argparse
+import multiprocessing
 from datetime import datetime
 from collections import Counter
+from itertools import compress
+from operator import not_
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+try:
+    import duckdb
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+ENGINES = ('csv', 'arrow', 'polars', 'duckdb')
+
+# Formats for the matched / without-SKU inventory outputs (parquet: arrow engine)
+OUTPUT_FORMATS = ('csv', 'parquet')
+
+# Characters removed by str.strip(), so SQL trim() and polars strip_chars()
+# match the csv engine
+STRIP_CHARS = (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003'
+    '\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000'
+)
+
+# Bytes that keep an inventory file off the raw byte-scan path: quotes and
+# carriage returns that are not part of a CRLF line ending
+_CSV_SPECIAL_BYTES = re.compile(rb'"|\r(?!\n)')
+
+# Bytes read per block by the inventory byte-scan path and the --workers chunks
+READ_BLOCK_SIZE = 1 << 20
+
+# Suffix of the pickle cache written next to the VTEX file by --sku-cache
+SKU_CACHE_SUFFIX = '.skuset.pkl'
+
+# DuckDB CSV reader: plain comma-separated text, every column as VARCHAR;
+# short rows are padded with NULLs (written back as empty fields) like the csv engine
+DUCKDB_READ_CSV = "read_csv(?, header=true, all_varchar=true, delim=',', quote='\"', escape='\"', null_padding=true)"
+
+
+def _load_vtex_json(file_path):
+    """
+    Parse a VTEX JSON export (list or dict of records).
+
+    Returns:
+        tuple: (list of records that have "_SKUReferenceCode", fieldnames list)
+    """
+    items = []
+    fieldnames = []
+
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    # Handle both list and dict formats
+    if isinstance(data, list):
+        if data:
+            fieldnames = list(data[0].keys())
+        items = [item for item in data if '_SKUReferenceCode' in item]
+    elif isinstance(data, dict):
+        items = [item for item in data.values()
+                 if isinstance(item, dict) and '_SKUReferenceCode' in item]
+        # Header comes from the first record kept
+        if items:
+            fieldnames = list(items[0].keys())
+
+    return items, fieldnames
 
 
 def load_vtex_data(file_path):
     """
-    Load VTEX SKU data from CSV or JSON file.
+    Load the set of VTEX SKU IDs from CSV or JSON file.
+
+    Only the SKU IDs are kept in memory; full rows are re-read with
+    iter_vtex_rows when writing the VTEX SKUs without inventory.
 
     Args:
         file_path: Path to VTEX products file (CSV or JSON)
 
     Returns:
-        tuple: (dict of SKU ID -> full row data, fieldnames list)
+        tuple: (set of SKU IDs, fieldnames list)
     """
-    vtex_data = {}
+    vtex_skus = set()
     fieldnames = []
+    # Interned SKU strings let inventory lookups match on identity
+    intern = sys.intern
 
     # Determine file type by extension
     if file_path.lower().endswith('.json'):
         # Load from JSON
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-            # Handle both list and dict formats
-            if isinstance(data, list):
-                if data:
-                    fieldnames = list(data[0].keys())
-                for item in data:
-                    if '_SKUReferenceCode' in item:
-                        sku_id = str(item['_SKUReferenceCode']).strip()
-                        if sku_id:
-                            vtex_data[sku_id] = item
-            elif isinstance(data, dict):
-                for item in data.values():
-                    if isinstance(item, dict) and '_SKUReferenceCode' in item:
-                        if not fieldnames and item:
-                            fieldnames = list(item.keys())
-                        sku_id = str(item['_SKUReferenceCode']).strip()
-                        if sku_id:
-                            vtex_data[sku_id] = item
+        items, fieldnames = _load_vtex_json(file_path)
+        for item in items:
+            sku_id = str(item['_SKUReferenceCode']).strip()
+            if sku_id:
+                vtex_skus.add(intern(sku_id))
 
     else:
         # Load from CSV
@@ -101,102 +185,821 @@ def load_vtex_data(file_path):
             for row in reader:
                 sku_id = str(row['_SKUReferenceCode']).strip()
                 if sku_id:
-                    vtex_data[sku_id] = row
+                    vtex_skus.add(intern(sku_id))
 
-    return vtex_data, fieldnames
+    return vtex_skus, fieldnames
 
 
-def filter_inventory(vtex_file, inventory_file, output_prefix):
+def load_vtex_data_cached(file_path, loader=load_vtex_data):
     """
-    Filter inventory and generate multiple output files.
+    Load the VTEX SKU set through an on-disk pickle cache.
+
+    The cache is stored next to the VTEX file (<file>.skuset.pkl) and is
+    reused while the VTEX file keeps the same modification time and size and
+    was built by the same loader (each engine trims SKUs its own way);
+    otherwise the file is parsed with loader and the cache is rewritten.
+
+    Returns:
+        tuple: (set of SKU IDs, fieldnames list)
+    """
+    cache_path = file_path + SKU_CACHE_SUFFIX
+    stat = os.stat(file_path)
+    key = (loader.__name__, stat.st_mtime_ns, stat.st_size)
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached['key'] == key:
+            print(f"Using cached VTEX SKU set: {cache_path}")
+            return cached['skus'], cached['fieldnames']
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, TypeError):
+        pass
+
+    vtex_skus, fieldnames = loader(file_path)
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump({'key': key, 'skus': vtex_skus, 'fieldnames': list(fieldnames)}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"Warning: could not write VTEX SKU cache {cache_path}: {e}")
+
+    return vtex_skus, fieldnames
+
+
+def iter_vtex_rows(file_path):
+    """Yield every VTEX record (dict) that has a "_SKUReferenceCode" field."""
+    if file_path.lower().endswith('.json'):
+        items, _ = _load_vtex_json(file_path)
+        yield from items
+    else:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+
+
+def write_vtex_without_inventory(vtex_file, vtex_fieldnames, missing_sku_ids, output_file):
+    """
+    Stream the VTEX file again and write the SKUs that have no inventory.
+
+    Each SKU is written once, from its first row in the VTEX file.
 
     Args:
         vtex_file: Path to VTEX products file (CSV or JSON)
-        inventory_file: Path to inventory CSV
-        output_prefix: Prefix for output files
+        vtex_fieldnames: Output header
+        missing_sku_ids: Set of VTEX SKU IDs without inventory (consumed)
+        output_file: Path to output CSV
     """
-    print(f"Loading VTEX SKU data from: {vtex_file}")
-    vtex_data, vtex_fieldnames = load_vtex_data(vtex_file)
-    print(f"Loaded {len(vtex_data)} unique SKU IDs from VTEX")
+    with open(output_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=vtex_fieldnames)
+        writer.writeheader()
+        for row in iter_vtex_rows(vtex_file):
+            if not missing_sku_ids:
+                break
+            sku_id = str(row['_SKUReferenceCode']).strip()
+            if sku_id in missing_sku_ids:
+                writer.writerow(row)
+                missing_sku_ids.discard(sku_id)
 
-    print(f"\nProcessing inventory: {inventory_file}")
 
-    matched_inventory = []
-    unmatched_inventory = []
-    found_sku_ids = set()
-    unmatched_sku_ids = set()
+def _arrow_string_columns(file_path):
+    """Map every header column of a CSV to string so Arrow keeps leading zeros."""
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        header = next(csv.reader(f), [])
+    return {name: pa.string() for name in header}
 
-    # Track warehouse counts per SKU
+
+def load_vtex_data_arrow(file_path):
+    """
+    Load VTEX SKU IDs with pyarrow's CSV reader (JSON files use load_vtex_data).
+
+    Args:
+        file_path: Path to VTEX products file (CSV or JSON)
+
+    Returns:
+        tuple: (set of SKU IDs, fieldnames list)
+    """
+    if file_path.lower().endswith('.json'):
+        return load_vtex_data(file_path)
+
+    column_types = _arrow_string_columns(file_path)
+    fieldnames = list(column_types)
+
+    # Check if required field exists
+    if '_SKUReferenceCode' not in fieldnames:
+        print(f"Error: Field '_SKUReferenceCode' not found in {file_path}")
+        print(f"Available fields: {', '.join(fieldnames)}")
+        sys.exit(1)
+
+    # Only the SKU column is needed for matching
+    try:
+        table = pa_csv.read_csv(
+            file_path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types=column_types,
+                include_columns=['_SKUReferenceCode']
+            )
+        )
+    except pa.ArrowInvalid as e:
+        # Arrow rejects rows with a different column count; the csv module
+        # pads them, so let it read the file
+        print(f"Warning: pyarrow could not parse {file_path} ({e}); reading it with the csv module")
+        return load_vtex_data(file_path)
+    # Trim and de-duplicate in Arrow kernels; only unique SKUs become Python strings
+    sku_ids = pc.unique(pc.utf8_trim_whitespace(table.column('_SKUReferenceCode')))
+    vtex_skus = set(sku_ids.to_pylist())
+    vtex_skus.discard('')
+
+    return vtex_skus, fieldnames
+
+
+def _classify_rows(reader, sku_idx, width, vtex_skus, matched_writer, unmatched_writer):
+    """
+    Write each inventory row to the matched or unmatched writer.
+
+    Returns:
+        tuple: (matched rows, unmatched rows, Counter of matched SKU -> warehouse
+        rows, Counter of unmatched SKU -> warehouse rows)
+    """
+    matched_rows = 0
+    unmatched_rows = 0
+    # Track warehouse counts per SKU (matched and unmatched)
     sku_warehouse_counts = Counter()
+    unmatched_warehouse_counts = Counter()
+    # SKUs repeat once per warehouse: interning keeps one string per SKU in
+    # the Counters and lets set/dict lookups match on identity
+    intern = sys.intern
+
+    for row in reader:
+        if len(row) < width:
+            if not row:
+                # Blank line
+                continue
+            # Pad short rows to the header, as DictReader/DictWriter did
+            row += [''] * (width - len(row))
+        sku_code = intern(row[sku_idx].strip())
+
+        # Counting per row is as fast here as collecting keys for a batched
+        # Counter.update: the increment already runs as C dict operations
+        if sku_code in vtex_skus:
+            matched_writer.writerow(row)
+            matched_rows += 1
+            sku_warehouse_counts[sku_code] += 1
+        else:
+            unmatched_writer.writerow(row)
+            unmatched_rows += 1
+            unmatched_warehouse_counts[sku_code] += 1
+
+    return matched_rows, unmatched_rows, sku_warehouse_counts, unmatched_warehouse_counts
+
+
+def _inventory_sku_index(inventory_file, inventory_fieldnames):
+    """Return the position of 'CODIGO SKU' in the inventory header, or exit."""
+    if 'CODIGO SKU' not in inventory_fieldnames:
+        print(f"Error: Field 'CODIGO SKU' not found in {inventory_file}")
+        print(f"Available fields: {', '.join(inventory_fieldnames)}")
+        sys.exit(1)
+    return inventory_fieldnames.index('CODIGO SKU')
 
-    # Read inventory
-    with open(inventory_file, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        inventory_fieldnames = reader.fieldnames
 
-        # Check if required field exists
-        if 'CODIGO SKU' not in inventory_fieldnames:
-            print(f"Error: Field 'CODIGO SKU' not found in {inventory_file}")
-            print(f"Available fields: {', '.join(inventory_fieldnames)}")
-            sys.exit(1)
+def _classify_inventory_csv(inventory_file, vtex_skus, matched_file, inventory_no_sku_file):
+    """
+    Split inventory rows into matched/unmatched files using the csv module.
 
-        # Filter rows
-        for row in reader:
-            sku_code = str(row['CODIGO SKU']).strip()
+    Returns:
+        tuple: (matched rows, unmatched rows, Counter of matched SKU -> warehouse
+        rows, Counter of unmatched SKU -> warehouse rows)
+    """
+    # Fast path: plain files with the SKU in the first column are scanned as bytes
+    with open(inventory_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                width = _plain_sku_first_width(mm)
+                if width:
+                    return _classify_inventory_mmap(mm, width, vtex_skus, matched_file, inventory_no_sku_file)
+
+    # Read inventory as plain lists; only the SKU column is looked at, by index
+    with open(inventory_file, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        inventory_fieldnames = next(reader, None) or []
+        sku_idx = _inventory_sku_index(inventory_file, inventory_fieldnames)
+
+        # Rows are written as they are classified, so memory does not grow
+        # with the size of the inventory
+        with open(matched_file, 'w', encoding='utf-8', newline='') as matched_out, \
+                open(inventory_no_sku_file, 'w', encoding='utf-8', newline='') as unmatched_out:
+            matched_writer = csv.writer(matched_out)
+            unmatched_writer = csv.writer(unmatched_out)
+            matched_writer.writerow(inventory_fieldnames)
+            unmatched_writer.writerow(inventory_fieldnames)
+
+            return _classify_rows(reader, sku_idx, len(inventory_fieldnames), vtex_skus,
+                                  matched_writer, unmatched_writer)
+
+
+def _plain_sku_first_width(mm):
+    """
+    Return the header width if the inventory can be classified as raw bytes.
 
-            if sku_code in vtex_data:
-                matched_inventory.append(row)
-                found_sku_ids.add(sku_code)
-                sku_warehouse_counts[sku_code] += 1
+    That is the case when "CODIGO SKU" is the first column, nothing is quoted
+    and every carriage return belongs to a CRLF line ending: each line is then
+    exactly one record and the csv module would write it back unchanged.
+    Returns 0 otherwise.
+    """
+    if _CSV_SPECIAL_BYTES.search(mm):
+        return 0
+    end = mm.find(b'\n')
+    header = mm[:end if end != -1 else len(mm)].rstrip(b'\r')
+    try:
+        fieldnames = header.decode('utf-8').split(',')
+    except UnicodeDecodeError:
+        return 0
+    return len(fieldnames) if fieldnames[0] == 'CODIGO SKU' else 0
+
+
+def _classify_inventory_mmap(mm, width, vtex_skus, matched_file, inventory_no_sku_file):
+    """
+    Split inventory lines into matched/unmatched files without parsing CSV.
+
+    The file is read in blocks of whole lines. When every line of a block has
+    exactly the header width, the SKU fields are pulled out with one regex
+    pass and the lines are routed with itertools.compress; other blocks
+    (blank, short or long lines) go through a per-line loop. Each distinct
+    SKU field is decoded once, lines are copied as bytes and joined with CRLF,
+    and short lines are padded to the header width, like csv.writer output.
+
+    Returns:
+        tuple: (matched rows, unmatched rows, Counter of matched SKU -> warehouse
+        rows, Counter of unmatched SKU -> warehouse rows)
+    """
+    matched_rows = 0
+    unmatched_rows = 0
+    sku_warehouse_counts = Counter()
+    unmatched_warehouse_counts = Counter()
+    # Raw leading field -> stripped, interned SKU; and the raw fields that match VTEX
+    decoded = {}
+    matched_keys = set()
+    intern = sys.intern
+    separators = width - 1
+    # One match per line that has exactly `width` fields; group 1 is the SKU field
+    full_line = re.compile(rb'^([^,\r\n]*)' + rb'(?:,[^,\r\n]*)' * separators + rb'\r?$', re.M)
+
+    def sku_for(key):
+        sku_code = decoded[key] = intern(key.decode('utf-8').strip())
+        if sku_code in vtex_skus:
+            matched_keys.add(key)
+        return sku_code
+
+    with open(matched_file, 'wb') as matched_out, open(inventory_no_sku_file, 'wb') as unmatched_out:
+        header = mm.readline().rstrip(b'\r\n') + b'\r\n'
+        matched_out.write(header)
+        unmatched_out.write(header)
+
+        while True:
+            # Whole lines only: extend each block to the end of its last line
+            block = mm.read(READ_BLOCK_SIZE)
+            if not block:
+                break
+            block += mm.readline()
+            lines = block.splitlines()
+            keys = full_line.findall(block)
+
+            if len(keys) == len(lines) and all(lines):
+                # Regular block: count raw fields, then route lines by field
+                for key, count in Counter(keys).items():
+                    sku_code = decoded.get(key)
+                    if sku_code is None:
+                        sku_code = sku_for(key)
+                    if key in matched_keys:
+                        sku_warehouse_counts[sku_code] += count
+                    else:
+                        unmatched_warehouse_counts[sku_code] += count
+                selectors = list(map(matched_keys.__contains__, keys))
+                matched_lines = list(compress(lines, selectors))
+                unmatched_lines = list(compress(lines, map(not_, selectors)))
             else:
-                unmatched_inventory.append(row)
-                unmatched_sku_ids.add(sku_code)
+                matched_lines = []
+                unmatched_lines = []
+                for line in lines:
+                    if not line:
+                        # Blank line
+                        continue
+                    missing = separators - line.count(b',')
+                    if missing > 0:
+                        line += b',' * missing
+                    comma = line.find(b',')
+                    key = line[:comma] if comma != -1 else line
+                    sku_code = decoded.get(key)
+                    if sku_code is None:
+                        sku_code = sku_for(key)
+
+                    if key in matched_keys:
+                        matched_lines.append(line)
+                        sku_warehouse_counts[sku_code] += 1
+                    else:
+                        unmatched_lines.append(line)
+                        unmatched_warehouse_counts[sku_code] += 1
+
+            for out, out_lines in ((matched_out, matched_lines), (unmatched_out, unmatched_lines)):
+                if out_lines:
+                    out.write(b'\r\n'.join(out_lines))
+                    out.write(b'\r\n')
+            matched_rows += len(matched_lines)
+            unmatched_rows += len(unmatched_lines)
+
+    return matched_rows, unmatched_rows, sku_warehouse_counts, unmatched_warehouse_counts
+
+
+# VTEX SKU set of a worker process, set once by _init_chunk_worker
+_worker_vtex_skus = None
+
+
+def _init_chunk_worker(vtex_skus):
+    """Pool initializer: keep the VTEX SKU set for every chunk of this worker."""
+    global _worker_vtex_skus
+    _worker_vtex_skus = vtex_skus
+
+
+def _iter_range_lines(f, start, end):
+    """
+    Yield the text lines of the byte range [start, end) of a binary file.
+
+    The range is read in blocks that end on a line boundary, so only one block
+    is held in memory at a time; lines are split like a text file opened with
+    newline=''.
+    """
+    f.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        block = f.read(min(READ_BLOCK_SIZE, remaining))
+        if not block:
+            break
+        if len(block) < remaining and not block.endswith(b'\n'):
+            block += f.readline()
+        remaining -= len(block)
+        yield from io.StringIO(block.decode('utf-8'), newline='')
+
+
+def _classify_chunk(task):
+    """
+    Classify the inventory rows in one byte range into two part files.
+
+    Part files have no header; they are concatenated by the parent process.
+    """
+    inventory_file, start, end, sku_idx, width, matched_part, unmatched_part = task
+    with open(inventory_file, 'rb') as f, \
+            open(matched_part, 'w', encoding='utf-8', newline='') as matched_out, \
+            open(unmatched_part, 'w', encoding='utf-8', newline='') as unmatched_out:
+        return _classify_rows(csv.reader(_iter_range_lines(f, start, end)), sku_idx, width,
+                              _worker_vtex_skus, csv.writer(matched_out), csv.writer(unmatched_out))
+
+
+def _chunk_offsets(f, start, size, chunks):
+    """Split [start, size) into byte ranges that begin and end on line boundaries."""
+    offsets = [start]
+    for k in range(1, chunks):
+        pos = start + (size - start) * k // chunks
+        if pos <= offsets[-1]:
+            continue
+        # Move to the start of the next line (a line starting exactly at pos is kept)
+        f.seek(pos - 1)
+        f.readline()
+        pos = f.tell()
+        if offsets[-1] < pos < size:
+            offsets.append(pos)
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+
+def _classify_inventory_csv_parallel(inventory_file, vtex_skus, matched_file, inventory_no_sku_file, workers):
+    """
+    Split inventory rows into matched/unmatched files using a pool of processes.
+
+    The file is cut into byte ranges on line boundaries and each range is
+    classified by a worker with the csv module. Fields must not contain line
+    breaks inside quotes, since a range could start in the middle of a record.
+
+    Returns:
+        tuple: (matched rows, unmatched rows, Counter of matched SKU -> warehouse
+        rows, Counter of unmatched SKU -> warehouse rows)
+    """
+    with open(inventory_file, 'rb') as f:
+        header_line = f.readline()
+        data_start = f.tell()
+        size = os.fstat(f.fileno()).st_size
+        ranges = _chunk_offsets(f, data_start, size, workers) if size > data_start else []
+
+    inventory_fieldnames = next(csv.reader([header_line.decode('utf-8')]), None) or []
+    sku_idx = _inventory_sku_index(inventory_file, inventory_fieldnames)
+    width = len(inventory_fieldnames)
+
+    tasks = [
+        (inventory_file, start, end, sku_idx, width,
+         f"{matched_file}.part{k}", f"{inventory_no_sku_file}.part{k}")
+        for k, (start, end) in enumerate(ranges)
+    ]
+
+    matched_rows = 0
+    unmatched_rows = 0
+    sku_warehouse_counts = Counter()
+    unmatched_warehouse_counts = Counter()
+
+    try:
+        with multiprocessing.Pool(min(workers, len(tasks)) or 1, initializer=_init_chunk_worker,
+                                  initargs=(vtex_skus,)) as pool:
+            results = pool.map(_classify_chunk, tasks)
+
+        # Merge counts in file order so SKUs keep their first-seen order
+        for matched, unmatched, counts, unmatched_counts in results:
+            matched_rows += matched
+            unmatched_rows += unmatched
+            sku_warehouse_counts.update(counts)
+            unmatched_warehouse_counts.update(unmatched_counts)
+
+        # Header first, then the part files in order
+        for output_file, part_index in ((matched_file, 5), (inventory_no_sku_file, 6)):
+            with open(output_file, 'w', encoding='utf-8', newline='') as out:
+                csv.writer(out).writerow(inventory_fieldnames)
+            with open(output_file, 'ab') as out:
+                for task in tasks:
+                    with open(task[part_index], 'rb') as part:
+                        shutil.copyfileobj(part, out)
+    finally:
+        for task in tasks:
+            for part_file in task[5:]:
+                if os.path.exists(part_file):
+                    os.remove(part_file)
+
+    return matched_rows, unmatched_rows, sku_warehouse_counts, unmatched_warehouse_counts
+
+
+def _classify_inventory_arrow(inventory_file, vtex_skus, matched_file, inventory_no_sku_file,
+                              output_format='csv'):
+    """
+    Split inventory rows into matched/unmatched files with pyarrow.
+
+    The inventory is streamed in record batches; matching runs as a C++ hash
+    lookup (pc.is_in) per batch and filtered batches go straight to the
+    output writers, so memory stays bounded by the batch size. With
+    output_format='parquet' the batches are written as zstd-compressed,
+    dictionary-encoded Parquet instead of CSV.
+
+    Arrow rejects rows whose column count differs from the header, which the
+    csv engine pads; such a file is reprocessed with the csv engine (or, for
+    Parquet output, rejected with an error).
+
+    Returns:
+        tuple: (matched rows, unmatched rows, Counter of matched SKU -> warehouse
+        rows, Counter of unmatched SKU -> warehouse rows)
+    """
+    try:
+        return _classify_inventory_arrow_batches(inventory_file, vtex_skus, matched_file, inventory_no_sku_file,
+                                                 output_format)
+    except pa.ArrowInvalid as e:
+        if output_format == 'parquet':
+            print(f"Error: pyarrow could not parse {inventory_file}: {e}")
+            print("Fix the rows with a different number of columns than the header, or use --format csv")
+            sys.exit(1)
+        print(f"Warning: pyarrow could not parse {inventory_file} ({e}); reprocessing it with the csv engine")
+        return _classify_inventory_csv(inventory_file, vtex_skus, matched_file, inventory_no_sku_file)
+
+
+def _classify_inventory_arrow_batches(inventory_file, vtex_skus, matched_file, inventory_no_sku_file,
+                                      output_format):
+    """Stream the inventory through pyarrow batches (see _classify_inventory_arrow)."""
+    reader = pa_csv.open_csv(
+        inventory_file,
+        convert_options=pa_csv.ConvertOptions(column_types=_arrow_string_columns(inventory_file))
+    )
+    schema = reader.schema
+
+    # Check if required field exists
+    if 'CODIGO SKU' not in schema.names:
+        print(f"Error: Field 'CODIGO SKU' not found in {inventory_file}")
+        print(f"Available fields: {', '.join(schema.names)}")
+        sys.exit(1)
+
+    vtex_sku_array = pa.array(list(vtex_skus), type=pa.string())
+    if output_format == 'parquet':
+        def open_writer(path):
+            return pq.ParquetWriter(path, schema, compression='zstd', use_dictionary=True)
+    else:
+        # Every value and the header quoted, stated explicitly rather than
+        # relying on 'needed' quoting every string column
+        write_options = pa_csv.WriteOptions(quoting_style='all_valid', eol='\r\n')
+
+        def open_writer(path):
+            return pa_csv.CSVWriter(path, schema, write_options=write_options)
+
+    matched_rows = 0
+    unmatched_rows = 0
+    # Track warehouse counts per SKU (matched and unmatched)
+    sku_warehouse_counts = Counter()
+    unmatched_warehouse_counts = Counter()
+
+    with open_writer(matched_file) as matched_writer, open_writer(inventory_no_sku_file) as unmatched_writer:
+        for batch in reader:
+            keys = pc.utf8_trim_whitespace(batch.column('CODIGO SKU'))
+            mask = pc.is_in(keys, value_set=vtex_sku_array)
+            inverse = pc.invert(mask)
+
+            matched = batch.filter(mask)
+            unmatched = batch.filter(inverse)
+            matched_writer.write_batch(matched)
+            unmatched_writer.write_batch(unmatched)
+
+            matched_rows += matched.num_rows
+            unmatched_rows += unmatched.num_rows
+            sku_warehouse_counts.update(keys.filter(mask).to_pylist())
+            unmatched_warehouse_counts.update(keys.filter(inverse).to_pylist())
+
+    return matched_rows, unmatched_rows, sku_warehouse_counts, unmatched_warehouse_counts
+
+
+def load_vtex_data_polars(file_path):
+    """
+    Load VTEX SKU IDs with a Polars lazy scan (JSON files use load_vtex_data).
+
+    Args:
+        file_path: Path to VTEX products file (CSV or JSON)
+
+    Returns:
+        tuple: (set of SKU IDs, fieldnames list)
+    """
+    if file_path.lower().endswith('.json'):
+        return load_vtex_data(file_path)
+
+    scan = pl.scan_csv(file_path, infer_schema=False, empty_string_is_null=False)
+    fieldnames = scan.collect_schema().names()
+
+    # Check if required field exists
+    if '_SKUReferenceCode' not in fieldnames:
+        print(f"Error: Field '_SKUReferenceCode' not found in {file_path}")
+        print(f"Available fields: {', '.join(fieldnames)}")
+        sys.exit(1)
+
+    sku_ids = (
+        scan.select(pl.col('_SKUReferenceCode').str.strip_chars(STRIP_CHARS).alias('sku'))
+        .filter(pl.col('sku') != '')
+        .unique()
+        .collect()
+    )
+    return set(sku_ids['sku'].to_list()), fieldnames
+
+
+def _blank_line_rows(file_path):
+    """
+    Return the data-row positions of the blank lines in a CSV file.
+
+    Polars reads a blank line as a row of nulls, indistinguishable from a
+    row of empty fields such as ",,". csv.reader yields [] only for blank
+    lines and numbers records the same way, so it finds their positions;
+    that pass only runs when the file contains an empty line at all.
+    """
+    if os.path.getsize(file_path) == 0:
+        return []
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'\n\n') == -1 and mm.find(b'\n\r\n') == -1:
+                return []
+
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        return [i for i, row in enumerate(reader) if not row]
+
+
+def _classify_inventory_polars(inventory_file, vtex_skus, matched_file, inventory_no_sku_file):
+    """
+    Split inventory rows into matched/unmatched files with Polars.
+
+    Matched rows are a semi-join and unmatched rows an anti-join of the
+    inventory against the VTEX SKUs, both streamed to disk with sink_csv.
+
+    Returns:
+        tuple: (matched rows, unmatched rows, Counter of matched SKU -> warehouse
+        rows, Counter of unmatched SKU -> warehouse rows)
+    """
+    # Empty fields, quoted or not, are read as null and written back as
+    # empty fields, as csv.writer does
+    inventory = pl.scan_csv(inventory_file, infer_schema=False, null_values=[''])
+    inventory_fieldnames = inventory.collect_schema().names()
+
+    # Check if required field exists
+    if 'CODIGO SKU' not in inventory_fieldnames:
+        print(f"Error: Field 'CODIGO SKU' not found in {inventory_file}")
+        print(f"Available fields: {', '.join(inventory_fieldnames)}")
+        sys.exit(1)
+
+    # Skip blank lines, as the csv engine does
+    blank_rows = _blank_line_rows(inventory_file)
+    if blank_rows:
+        inventory = (
+            inventory.with_row_index('__row')
+            .filter(~pl.col('__row').is_in(blank_rows))
+            .drop('__row')
+        )
+    sku = pl.col('CODIGO SKU').fill_null('').str.strip_chars(STRIP_CHARS)
+    vtex = pl.LazyFrame({'sku': list(vtex_skus)}, schema={'sku': pl.String})
+
+    for how, output_file in (('semi', matched_file), ('anti', inventory_no_sku_file)):
+        (
+            inventory.join(vtex, left_on=sku, right_on='sku', how=how, maintain_order='left')
+            .sink_csv(output_file, line_terminator='\r\n')
+        )
+
+    # Warehouse rows per SKU, split by whether the SKU exists in VTEX
+    per_sku = inventory.select(sku.alias('sku')).group_by('sku').len().collect()
+    sku_warehouse_counts = Counter()
+    unmatched_warehouse_counts = Counter()
+    for sku_code, rows in zip(per_sku['sku'].to_list(), per_sku['len'].to_list()):
+        if sku_code in vtex_skus:
+            sku_warehouse_counts[sku_code] = rows
+        else:
+            unmatched_warehouse_counts[sku_code] = rows
+
+    return (
+        sum(sku_warehouse_counts.values()),
+        sum(unmatched_warehouse_counts.values()),
+        sku_warehouse_counts,
+        unmatched_warehouse_counts
+    )
+
+
+def _sql_path(path):
+    """Quote a file path as a SQL string literal (COPY TO cannot take parameters)."""
+    return "'" + path.replace("'", "''") + "'"
+
+
+def load_vtex_data_duckdb(con, file_path):
+    """
+    Load VTEX SKU IDs into the DuckDB table "vtex" (JSON files use load_vtex_data).
+
+    Args:
+        con: DuckDB connection
+        file_path: Path to VTEX products file (CSV or JSON)
+
+    Returns:
+        tuple: (set of SKU IDs, fieldnames list)
+    """
+    if file_path.lower().endswith('.json'):
+        vtex_skus, fieldnames = load_vtex_data(file_path)
+        con.execute("CREATE TEMP TABLE vtex AS SELECT unnest(?::VARCHAR[]) AS sku", [list(vtex_skus)])
+        return vtex_skus, fieldnames
+
+    fieldnames = [col[0] for col in con.execute(f"SELECT * FROM {DUCKDB_READ_CSV} LIMIT 0", [file_path]).description]
+
+    # Check if required field exists
+    if '_SKUReferenceCode' not in fieldnames:
+        print(f"Error: Field '_SKUReferenceCode' not found in {file_path}")
+        print(f"Available fields: {', '.join(fieldnames)}")
+        sys.exit(1)
+
+    con.execute(
+        f"""CREATE TEMP TABLE vtex AS
+            SELECT DISTINCT trim("_SKUReferenceCode", ?) AS sku FROM {DUCKDB_READ_CSV}
+            WHERE coalesce(trim("_SKUReferenceCode", ?), '') <> ''""",
+        [STRIP_CHARS, file_path, STRIP_CHARS]
+    )
+    vtex_skus = {sku for (sku,) in con.execute("SELECT sku FROM vtex").fetchall()}
+    return vtex_skus, fieldnames
+
+
+def _classify_inventory_duckdb(con, inventory_file, matched_file, inventory_no_sku_file):
+    """
+    Split inventory rows into matched/unmatched files with DuckDB.
+
+    The inventory CSV is parsed once into a temp table with a trimmed SKU
+    key; the output files are a SEMI JOIN and an ANTI JOIN against the
+    "vtex" table written with COPY in inventory order, and warehouse counts come from one
+    GROUP BY.
+
+    Returns:
+        tuple: (matched rows, unmatched rows, Counter of matched SKU -> warehouse
+        rows, Counter of unmatched SKU -> warehouse rows)
+    """
+    inventory_fieldnames = [
+        col[0] for col in con.execute(f"SELECT * FROM {DUCKDB_READ_CSV} LIMIT 0", [inventory_file]).description
+    ]
+
+    # Check if required field exists
+    if 'CODIGO SKU' not in inventory_fieldnames:
+        print(f"Error: Field 'CODIGO SKU' not found in {inventory_file}")
+        print(f"Available fields: {', '.join(inventory_fieldnames)}")
+        sys.exit(1)
+
+    con.execute(
+        f"""CREATE TEMP TABLE inv AS
+            SELECT *, coalesce(trim("CODIGO SKU", ?), '') AS __sku FROM {DUCKDB_READ_CSV}""",
+        [STRIP_CHARS, inventory_file]
+    )
 
-    # Find VTEX SKUs without inventory
-    vtex_without_inventory = []
-    for sku_id, sku_data in vtex_data.items():
-        if sku_id not in found_sku_ids:
-            vtex_without_inventory.append(sku_data)
+    # Joins do not keep input order; inv is filled in file order (insertion
+    # order is preserved), so its rowid is the inventory row number
+    for join, output_file in (('SEMI', matched_file), ('ANTI', inventory_no_sku_file)):
+        con.execute(
+            f"""COPY (SELECT inv.* EXCLUDE (__sku) FROM inv {join} JOIN vtex ON inv.__sku = vtex.sku
+                      ORDER BY inv.rowid)
+                TO {_sql_path(output_file)} (HEADER, DELIMITER ',', NEW_LINE '\r\n')"""
+        )
+
+    # Warehouse rows per SKU, split by whether the SKU exists in VTEX
+    sku_warehouse_counts = Counter()
+    unmatched_warehouse_counts = Counter()
+    per_sku = con.execute(
+        """SELECT inv.__sku, count(*), vtex.sku IS NOT NULL
+           FROM inv LEFT JOIN vtex ON inv.__sku = vtex.sku
+           GROUP BY inv.__sku, vtex.sku"""
+    ).fetchall()
+    for sku_code, rows, matched in per_sku:
+        if matched:
+            sku_warehouse_counts[sku_code] = rows
+        else:
+            unmatched_warehouse_counts[sku_code] = rows
+
+    return (
+        sum(sku_warehouse_counts.values()),
+        sum(unmatched_warehouse_counts.values()),
+        sku_warehouse_counts,
+        unmatched_warehouse_counts
+    )
+
+
+def filter_inventory(vtex_file, inventory_file, output_prefix, engine='csv', workers=1, sku_cache=False,
+                     output_format='csv'):
+    """
+    Filter inventory and generate multiple output files.
+
+    Args:
+        vtex_file: Path to VTEX products file (CSV or JSON)
+        inventory_file: Path to inventory CSV
+        output_prefix: Prefix for output files
+        engine: 'csv' (standard library), 'arrow' (pyarrow, streamed in batches)
+            'polars' (semi/anti joins streamed with sink_csv) or 'duckdb' (SQL
+            SEMI/ANTI JOIN written with COPY)
+        workers: Number of processes for the csv engine (1 = single process)
+        sku_cache: Reuse a pickle cache of the VTEX SKU set between runs
+        output_format: 'csv' or 'parquet' (arrow engine) for the matched and
+            without-SKU inventory outputs
+    """
+    print(f"Loading VTEX SKU data from: {vtex_file}")
+    con = duckdb.connect() if engine == 'duckdb' else None
+    if engine == 'duckdb':
+        vtex_skus, vtex_fieldnames = load_vtex_data_duckdb(con, vtex_file)
+    else:
+        if engine == 'arrow':
+            loader = load_vtex_data_arrow
+        elif engine == 'polars':
+            loader = load_vtex_data_polars
+        else:
+            loader = load_vtex_data
+        if sku_cache:
+            vtex_skus, vtex_fieldnames = load_vtex_data_cached(vtex_file, loader)
+        else:
+            vtex_skus, vtex_fieldnames = loader(vtex_file)
+    print(f"Loaded {len(vtex_skus)} unique SKU IDs from VTEX")
 
     # Generate output filenames
-    matched_file = f"{output_prefix}_matched.csv"
+    matched_file = f"{output_prefix}_matched.{output_format}"
     vtex_no_inventory_file = f"{output_prefix}_vtex_without_inventory.csv"
-    inventory_no_sku_file = f"{output_prefix}_inventory_without_sku.csv"
+    inventory_no_sku_file = f"{output_prefix}_inventory_without_sku.{output_format}"
     report_file = f"{output_prefix}_REPORT.md"
 
-    # Write matched inventory
-    print(f"\nWriting matched inventory to: {matched_file}")
-    with open(matched_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=inventory_fieldnames)
-        writer.writeheader()
-        writer.writerows(matched_inventory)
+    print(f"\nProcessing inventory: {inventory_file}")
+    print(f"Writing matched inventory to: {matched_file}")
+    print(f"Writing inventory without VTEX SKUs to: {inventory_no_sku_file}")
 
-    # Write VTEX SKUs without inventory
-    print(f"Writing VTEX SKUs without inventory to: {vtex_no_inventory_file}")
-    with open(vtex_no_inventory_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=vtex_fieldnames)
-        writer.writeheader()
-        writer.writerows(vtex_without_inventory)
+    if engine == 'arrow':
+        classified = _classify_inventory_arrow(inventory_file, vtex_skus, matched_file, inventory_no_sku_file,
+                                               output_format)
+    elif engine == 'polars':
+        classified = _classify_inventory_polars(inventory_file, vtex_skus, matched_file, inventory_no_sku_file)
+    elif engine == 'duckdb':
+        classified = _classify_inventory_duckdb(con, inventory_file, matched_file, inventory_no_sku_file)
+        con.close()
+    elif workers > 1:
+        classified = _classify_inventory_csv_parallel(inventory_file, vtex_skus, matched_file,
+                                                      inventory_no_sku_file, workers)
+    else:
+        classified = _classify_inventory_csv(inventory_file, vtex_skus, matched_file, inventory_no_sku_file)
+    matched_inventory_rows, unmatched_inventory_rows, sku_warehouse_counts, unmatched_warehouse_counts = classified
+    found_sku_ids = sku_warehouse_counts.keys()
 
-    # Write inventory without VTEX SKUs
-    print(f"Writing inventory without VTEX SKUs to: {inventory_no_sku_file}")
-    with open(inventory_no_sku_file, 'w', encoding='utf-8', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=inventory_fieldnames)
-        writer.writeheader()
-        writer.writerows(unmatched_inventory)
+    # VTEX SKUs without inventory, as a set difference computed in C
+    missing_sku_ids = vtex_skus.difference(found_sku_ids)
+    vtex_without_inventory_count = len(missing_sku_ids)
+
+    # Write VTEX SKUs without inventory (rows are re-read from the VTEX file)
+    print(f"Writing VTEX SKUs without inventory to: {vtex_no_inventory_file}")
+    write_vtex_without_inventory(vtex_file, vtex_fieldnames, missing_sku_ids, vtex_no_inventory_file)
 
     # Calculate statistics
-    total_vtex = len(vtex_data)
+    total_vtex = len(vtex_skus)
     vtex_with_inventory = len(found_sku_ids)
-    vtex_without_inventory_count = len(vtex_without_inventory)
 
-    total_inventory_rows = len(matched_inventory) + len(unmatched_inventory)
-    matched_inventory_rows = len(matched_inventory)
-    unmatched_inventory_rows = len(unmatched_inventory)
+    total_inventory_rows = matched_inventory_rows + unmatched_inventory_rows
 
-    total_unique_inventory_skus = len(found_sku_ids) + len(unmatched_sku_ids)
+    total_unique_inventory_skus = len(found_sku_ids) + len(unmatched_warehouse_counts)
     unique_matched_skus = len(found_sku_ids)
-    unique_unmatched_skus = len(unmatched_sku_ids)
+    unique_unmatched_skus = len(unmatched_warehouse_counts)
 
     # Warehouse distribution statistics
     avg_warehouses = matched_inventory_rows / unique_matched_skus if unique_matched_skus > 0 else 0
@@ -216,7 +1019,15 @@ def filter_inventory(vtex_file, inventory_file, output_prefix):
         'unique_unmatched_skus': unique_unmatched_skus,
         'avg_warehouses': avg_warehouses,
         'max_warehouses': max_warehouses,
-        'min_warehouses': min_warehouses
+        'min_warehouses': min_warehouses,
+        # Percentages are computed once here (0 when the total is 0) and
+        # shared by the console summary and the report
+        'vtex_with_inv_pct': _pct(vtex_with_inventory, total_vtex),
+        'vtex_without_inv_pct': _pct(vtex_without_inventory_count, total_vtex),
+        'matched_rows_pct': _pct(matched_inventory_rows, total_inventory_rows),
+        'unmatched_rows_pct': _pct(unmatched_inventory_rows, total_inventory_rows),
+        'unique_matched_pct': _pct(unique_matched_skus, total_unique_inventory_skus),
+        'unique_unmatched_pct': _pct(unique_unmatched_skus, total_unique_inventory_skus),
     }
 
     # Prepare file paths dictionary
@@ -242,18 +1053,18 @@ def filter_inventory(vtex_file, inventory_file, output_prefix):
     print(f"{'='*70}")
     print(f"VTEX SKUs:")
     print(f"  Total in VTEX:               {total_vtex:,}")
-    print(f"  With inventory (matched):    {vtex_with_inventory:,} ({vtex_with_inventory/total_vtex*100:.1f}%)")
-    print(f"  Without inventory:           {vtex_without_inventory_count:,} ({vtex_without_inventory_count/total_vtex*100:.1f}%)")
+    print(f"  With inventory (matched):    {vtex_with_inventory:,} ({stats['vtex_with_inv_pct']:.1f}%)")
+    print(f"  Without inventory:           {vtex_without_inventory_count:,} ({stats['vtex_without_inv_pct']:.1f}%)")
 
     print(f"\nInventory Records:")
     print(f"  Total records:               {total_inventory_rows:,}")
-    print(f"  With VTEX SKU (matched):     {matched_inventory_rows:,} ({matched_inventory_rows/total_inventory_rows*100:.1f}%)")
-    print(f"  Without VTEX SKU:            {unmatched_inventory_rows:,} ({unmatched_inventory_rows/total_inventory_rows*100:.1f}%)")
+    print(f"  With VTEX SKU (matched):     {matched_inventory_rows:,} ({stats['matched_rows_pct']:.1f}%)")
+    print(f"  Without VTEX SKU:            {unmatched_inventory_rows:,} ({stats['unmatched_rows_pct']:.1f}%)")
 
     print(f"\nInventory Unique SKUs:")
     print(f"  Total unique SKUs:           {total_unique_inventory_skus:,}")
-    print(f"  Matched with VTEX:           {unique_matched_skus:,} ({unique_matched_skus/total_unique_inventory_skus*100:.1f}%)")
-    print(f"  Without VTEX match:          {unique_unmatched_skus:,} ({unique_unmatched_skus/total_unique_inventory_skus*100:.1f}%)")
+    print(f"  Matched with VTEX:           {unique_matched_skus:,} ({stats['unique_matched_pct']:.1f}%)")
+    print(f"  Without VTEX match:          {unique_unmatched_skus:,} ({stats['unique_unmatched_pct']:.1f}%)")
 
     print(f"\nWarehouse Distribution:")
     print(f"  Avg warehouses per SKU:      {avg_warehouses:.1f}")
@@ -270,6 +1081,44 @@ def filter_inventory(vtex_file, inventory_file, output_prefix):
     print(f"{'='*70}")
 
 
+# Static closing sections of the Markdown report
+REPORT_FOOTER = """### Data Quality Checks
+- Verify warehouse codes in `CODIGO SUCURSAL` match VTEX warehouse IDs
+- Check for negative quantities in `EXISTENCIA` field
+- Validate SKU code format (leading zeros preserved)
+
+## Matching Logic
+
+- **Match Field (VTEX):** `_SKUReferenceCode`
+- **Match Field (Inventory):** `CODIGO SKU`
+- **Match Type:** Exact string match (case-sensitive, whitespace trimmed)
+- **Duplicate Handling:** Multiple warehouse records per SKU are preserved
+
+## Notes
+
+- Each SKU in inventory can appear multiple times (one per warehouse)
+- Matched records include ALL warehouse locations for each SKU
+- Use `unique SKU counts` for product-level analysis
+- Use `record counts` for warehouse-level analysis
+
+---
+
+*Generated by VTEX Inventory Filter*
+"""
+
+
+def _pct(count, total):
+    """Percentage of count over total, 0 when total is 0."""
+    return count / total * 100 if total > 0 else 0
+
+
+def _metric_table(rows):
+    """Render (metric, count, percentage) tuples as a Markdown table."""
+    lines = ["| Metric | Count | Percentage |", "|--------|-------|------------|"]
+    lines += [f"| {metric} | {count:,} | {pct:.1f}% |" for metric, count, pct in rows]
+    return "\n".join(lines)
+
+
 def generate_report(report_file, vtex_file, inventory_file, stats, file_paths):
     """
     Generate a detailed markdown report.
@@ -298,118 +1147,95 @@ def generate_report(report_file, vtex_file, inventory_file, stats, file_paths):
     vtex_no_inventory_file = file_paths['vtex_no_inventory_file']
     inventory_no_sku_file = file_paths['inventory_no_sku_file']
 
-    # Calculate percentages safely
-    vtex_with_inv_pct = vtex_with_inv/total_vtex*100 if total_vtex > 0 else 0
-    vtex_without_inv_pct = vtex_without_inv/total_vtex*100 if total_vtex > 0 else 0
-
-    matched_rows_pct = matched_rows/total_inv_rows*100 if total_inv_rows > 0 else 0
-    unmatched_rows_pct = unmatched_rows/total_inv_rows*100 if total_inv_rows > 0 else 0
-
-    unique_matched_pct = unique_matched/total_unique_inv*100 if total_unique_inv > 0 else 0
-    unique_unmatched_pct = unique_unmatched/total_unique_inv*100 if total_unique_inv > 0 else 0
-
-    report = f"""# VTEX Inventory Filter Report
-
-**Generated:** {timestamp}
-
-## Input Files
-
-- **VTEX Products:** `{vtex_file}`
-- **Inventory Data:** `{inventory_file}`
-
-## Summary Statistics
-
-### VTEX SKUs Analysis
-
-| Metric | Count | Percentage |
-|--------|-------|------------|
-| Total VTEX SKUs | {total_vtex:,} | 100.0% |
-| SKUs with inventory (matched) | {vtex_with_inv:,} | {vtex_with_inv_pct:.1f}% |
-| SKUs without inventory | {vtex_without_inv:,} | {vtex_without_inv_pct:.1f}% |
-
-### Inventory Records Analysis
-
-| Metric | Count | Percentage |
-|--------|-------|------------|
-| Total inventory records | {total_inv_rows:,} | 100.0% |
-| Records with VTEX SKU (matched) | {matched_rows:,} | {matched_rows_pct:.1f}% |
-| Records without VTEX SKU | {unmatched_rows:,} | {unmatched_rows_pct:.1f}% |
-
-### Inventory Unique SKUs Analysis
-
-| Metric | Count | Percentage |
-|--------|-------|------------|
-| Total unique SKUs in inventory | {total_unique_inv:,} | 100.0% |
-| Unique SKUs matched with VTEX | {unique_matched:,} | {unique_matched_pct:.1f}% |
-| Unique SKUs without VTEX match | {unique_unmatched:,} | {unique_unmatched_pct:.1f}% |
-
-### Warehouse Distribution
-
-| Metric | Value |
-|--------|-------|
-| Average warehouses per matched SKU | {avg_warehouses:.1f} |
-| Max warehouses for single SKU | {max_warehouses} |
-| Min warehouses for matched SKU | {min_warehouses} |
-
-## Output Files
-
-### 1. Matched Inventory Records
-**File:** `{matched_file}`
-**Description:** Inventory records with corresponding VTEX SKUs
-**Records:** {matched_rows:,} rows across {unique_matched:,} unique SKUs
-
-These inventory records can be uploaded to VTEX. Each SKU may appear multiple times (once per warehouse location).
-
-### 2. VTEX SKUs Without Inventory
-**File:** `{vtex_no_inventory_file}`
-**Description:** VTEX SKUs missing inventory data
-**Records:** {vtex_without_inv:,} unique SKUs
-
-Action required: Add inventory data for these SKUs across warehouse locations.
-
-### 3. Inventory Records Without VTEX SKUs
-**File:** `{inventory_no_sku_file}`
-**Description:** Inventory records for products not in VTEX
-**Records:** {unmatched_rows:,} rows across {unique_unmatched:,} unique SKUs
-
-Action required: Create these {unique_unmatched:,} products in VTEX before uploading inventory.
-
-## Recommendations
-
-### If VTEX SKUs Without Inventory > 0
-- Review the {vtex_without_inv:,} SKUs in `{vtex_no_inventory_file}`
-- Add inventory data for these products
-- Ensure all warehouse locations are represented
-- Re-run the filter to verify completeness
-
-### If Inventory Records Without VTEX SKUs > 0
-- Review the {unique_unmatched:,} unique SKUs in `{inventory_no_sku_file}`
-- Create these products in VTEX using the product creation workflow (steps 11-15)
-- After creation, re-run the filter to match the new inventory
-
-### Data Quality Checks
-- Verify warehouse codes in `CODIGO SUCURSAL` match VTEX warehouse IDs
-- Check for negative quantities in `EXISTENCIA` field
-- Validate SKU code format (leading zeros preserved)
-
-## Matching Logic
-
-- **Match Field (VTEX):** `_SKUReferenceCode`
-- **Match Field (Inventory):** `CODIGO SKU`
-- **Match Type:** Exact string match (case-sensitive, whitespace trimmed)
-- **Duplicate Handling:** Multiple warehouse records per SKU are preserved
-
-## Notes
-
-- Each SKU in inventory can appear multiple times (one per warehouse)
-- Matched records include ALL warehouse locations for each SKU
-- Use `unique SKU counts` for product-level analysis
-- Use `record counts` for warehouse-level analysis
-
----
-
-*Generated by VTEX Inventory Filter*
-"""
+    # Summary tables: one precomputed row per metric
+    vtex_table = _metric_table([
+        ('Total VTEX SKUs', total_vtex, 100.0),
+        ('SKUs with inventory (matched)', vtex_with_inv, stats['vtex_with_inv_pct']),
+        ('SKUs without inventory', vtex_without_inv, stats['vtex_without_inv_pct']),
+    ])
+    records_table = _metric_table([
+        ('Total inventory records', total_inv_rows, 100.0),
+        ('Records with VTEX SKU (matched)', matched_rows, stats['matched_rows_pct']),
+        ('Records without VTEX SKU', unmatched_rows, stats['unmatched_rows_pct']),
+    ])
+    unique_table = _metric_table([
+        ('Total unique SKUs in inventory', total_unique_inv, 100.0),
+        ('Unique SKUs matched with VTEX', unique_matched, stats['unique_matched_pct']),
+        ('Unique SKUs without VTEX match', unique_unmatched, stats['unique_unmatched_pct']),
+    ])
+
+    parts = [
+        "# VTEX Inventory Filter Report",
+        "",
+        f"**Generated:** {timestamp}",
+        "",
+        "## Input Files",
+        "",
+        f"- **VTEX Products:** `{vtex_file}`",
+        f"- **Inventory Data:** `{inventory_file}`",
+        "",
+        "## Summary Statistics",
+        "",
+        "### VTEX SKUs Analysis",
+        "",
+        vtex_table,
+        "",
+        "### Inventory Records Analysis",
+        "",
+        records_table,
+        "",
+        "### Inventory Unique SKUs Analysis",
+        "",
+        unique_table,
+        "",
+        "### Warehouse Distribution",
+        "",
+        "| Metric | Value |",
+        "|--------|-------|",
+        f"| Average warehouses per matched SKU | {avg_warehouses:.1f} |",
+        f"| Max warehouses for single SKU | {max_warehouses} |",
+        f"| Min warehouses for matched SKU | {min_warehouses} |",
+        "",
+        "## Output Files",
+        "",
+        "### 1. Matched Inventory Records",
+        f"**File:** `{matched_file}`",
+        "**Description:** Inventory records with corresponding VTEX SKUs",
+        f"**Records:** {matched_rows:,} rows across {unique_matched:,} unique SKUs",
+        "",
+        "These inventory records can be uploaded to VTEX. Each SKU may appear multiple times "
+        "(once per warehouse location).",
+        "",
+        "### 2. VTEX SKUs Without Inventory",
+        f"**File:** `{vtex_no_inventory_file}`",
+        "**Description:** VTEX SKUs missing inventory data",
+        f"**Records:** {vtex_without_inv:,} unique SKUs",
+        "",
+        "Action required: Add inventory data for these SKUs across warehouse locations.",
+        "",
+        "### 3. Inventory Records Without VTEX SKUs",
+        f"**File:** `{inventory_no_sku_file}`",
+        "**Description:** Inventory records for products not in VTEX",
+        f"**Records:** {unmatched_rows:,} rows across {unique_unmatched:,} unique SKUs",
+        "",
+        f"Action required: Create these {unique_unmatched:,} products in VTEX before uploading inventory.",
+        "",
+        "## Recommendations",
+        "",
+        "### If VTEX SKUs Without Inventory > 0",
+        f"- Review the {vtex_without_inv:,} SKUs in `{vtex_no_inventory_file}`",
+        "- Add inventory data for these products",
+        "- Ensure all warehouse locations are represented",
+        "- Re-run the filter to verify completeness",
+        "",
+        "### If Inventory Records Without VTEX SKUs > 0",
+        f"- Review the {unique_unmatched:,} unique SKUs in `{inventory_no_sku_file}`",
+        "- Create these products in VTEX using the product creation workflow (steps 11-15)",
+        "- After creation, re-run the filter to match the new inventory",
+        "",
+        REPORT_FOOTER,
+    ]
+    report = "\n".join(parts)
 
     with open(report_file, 'w', encoding='utf-8') as f:
         f.write(report)
@@ -439,17 +1265,45 @@ Notes:
   - Each SKU in inventory can appear multiple times (one per warehouse)
   - All warehouse records for matched SKUs are included in output
   - Report includes both record counts and unique SKU counts
+
+Engines (--engine):
+  - csv: standard library only (default)
+  - arrow: pyarrow batch reader/writer (pip install pyarrow)
+  - polars: Polars semi/anti joins with streaming sinks (pip install polars)
+  - duckdb: DuckDB SQL SEMI/ANTI JOIN written with COPY (pip install duckdb)
+
+Parallel classification (--workers N, csv engine only):
+  python3 filter_inventory.py vtex_skus.csv inventory.csv output --workers 4
+
+Repeated runs against the same VTEX export (--sku-cache):
+  python3 filter_inventory.py vtex_skus.csv inventory.csv output --sku-cache
+
+Parquet outputs (--format parquet, arrow engine only):
+  python3 filter_inventory.py vtex_skus.csv inventory.csv output --engine arrow --format parquet
         '''
     )
 
     parser.add_argument('vtex_file', help='VTEX products file (CSV or JSON)')
     parser.add_argument('inventory_file', help='Inventory CSV file')
     parser.add_argument('output_prefix', help='Prefix for output files')
+    parser.add_argument('--engine', choices=ENGINES, default='csv',
+                        help='Processing engine: csv (default, standard library), '
+                             'arrow (pyarrow, streams the inventory in batches) or '
+                             'polars (semi/anti joins with streaming sinks) or '
+                             'duckdb (SQL SEMI/ANTI JOIN)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Processes used by the csv engine to classify the inventory '
+                             '(default: 1). Requires no line breaks inside quoted fields')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv', dest='output_format',
+                        help='Format of the matched and without-SKU inventory outputs: csv (default) '
+                             'or parquet (zstd, requires --engine arrow)')
+    parser.add_argument('--sku-cache', action='store_true',
+                        help='Cache the VTEX SKU set in <vtex_file>.skuset.pkl and reuse it '
+                             'while the VTEX file is unchanged (mtime and size)')
 
     args = parser.parse_args()
 
     # Validate input files exist
-    import os
     if not os.path.exists(args.vtex_file):
         print(f"Error: VTEX file not found: {args.vtex_file}")
         sys.exit(1)
@@ -458,8 +1312,37 @@ Notes:
         print(f"Error: Inventory file not found: {args.inventory_file}")
         sys.exit(1)
 
+    if args.engine == 'arrow' and not PYARROW_AVAILABLE:
+        print("Error: --engine arrow requires pyarrow. Install it with: pip install pyarrow")
+        sys.exit(1)
+
+    if args.engine == 'polars' and not POLARS_AVAILABLE:
+        print("Error: --engine polars requires polars. Install it with: pip install polars")
+        sys.exit(1)
+
+    if args.engine == 'duckdb' and not DUCKDB_AVAILABLE:
+        print("Error: --engine duckdb requires duckdb. Install it with: pip install duckdb")
+        sys.exit(1)
+
+    if args.workers < 1:
+        print("Error: --workers must be at least 1")
+        sys.exit(1)
+
+    if args.workers > 1 and args.engine != 'csv':
+        print("Error: --workers is only supported by --engine csv")
+        sys.exit(1)
+
+    if args.output_format == 'parquet' and args.engine != 'arrow':
+        print("Error: --format parquet is only supported by --engine arrow")
+        sys.exit(1)
+
+    if args.sku_cache and args.engine == 'duckdb':
+        print("Error: --sku-cache is not supported by --engine duckdb")
+        sys.exit(1)
+
     # Run filter
-    filter_inventory(args.vtex_file, args.inventory_file, args.output_prefix)
+    filter_inventory(args.vtex_file, args.inventory_file, args.output_prefix, args.engine, args.workers,
+                     args.sku_cache, args.output_format)
 
 
 if __name__ == '__main__':
@@ -12,16 +12,25 @@ with Category ID plus a fixed Name.
 
 Features:
 - Rate limiting with configurable delay between requests
+- Concurrent requests with a bounded worker pool (--workers)
+- Optional HTTP/2 client (--http2, requires httpx[http2])
 - Exponential backoff for rate limit errors (429)
+- Honors Retry-After / X-RateLimit-* response headers
 - Dry-run mode for testing without creating groups
+- Resume from a previous run's successful output (--resume)
 - Comprehensive error handling and retry logic
-- Export results to JSON and CSV
+- Results written to JSONL and CSV as each request completes
+- Per-row lines on the console only with --verbose; --log-file keeps them all
+- Optional multi-process CSV parsing for very large files (--parse-workers)
+- Optional one-time CategoryId existence check per category (--check-categories)
 - Generate detailed markdown reports
 
 Usage:
     python3 vtex_specificationgroup_create.py input.csv
     python3 vtex_specificationgroup_create.py input.csv --dry-run
     python3 vtex_specificationgroup_create.py input.csv --delay 2.0
+    python3 vtex_specificationgroup_create.py input.csv --workers 8 --delay 0.1
+    python3 vtex_specificationgroup_create.py input.csv --resume 20260101_120000_specificationgroup_creation_successful.jsonl
     python3 31_vtex_specificationgroup_create/vtex_specificationgroup_create.py 61_sku_spec_matcher/resultado_20260601_214458_category_ids.csv \
         --category-id-column "Category ID" --fixed-name "Especificaciones (SKU)" --dry-run
 
@@ -42,23 +51,51 @@ Environment Variables (.env):
     VTEX_ENVIRONMENT=vtexcommercestable
 
 Output Files:
-    - TIMESTAMP_specificationgroup_creation_successful.json (full API responses)
+    - TIMESTAMP_specificationgroup_creation_successful.jsonl (one created group per line)
     - TIMESTAMP_specificationgroup_creation_successful.csv (Id, GroupId, CategoryId, Name, Position, StatusCode)
-    - TIMESTAMP_specificationgroup_creation_failed.json (error details)
+    - TIMESTAMP_specificationgroup_creation_failed.jsonl (error details, one per line)
     - TIMESTAMP_specificationgroup_creation_failed.csv (errors for manual review)
     - TIMESTAMP_specificationgroup_creation_REPORT.md (comprehensive report)
 """
 
 import csv
 import json
+import logging
 import os
 import sys
 import time
 import argparse
+import contextlib
+import io
+import itertools
+import multiprocessing
+import threading
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import httpx
+    import h2  # noqa: F401 - httpx needs it for http2=True
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# Errors raised by either HTTP client (response bodies are parsed with
+# loads_json, so invalid JSON surfaces as json.JSONDecodeError)
+TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+REQUEST_ERRORS = (requests.exceptions.RequestException, json.JSONDecodeError)
+if HTTPX_AVAILABLE:
+    TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    REQUEST_ERRORS += (httpx.HTTPError,)
+
 # Load .env from project root
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 env_path = os.path.join(project_root, '.env')
@@ -70,46 +107,270 @@ VTEX_APP_TOKEN = os.getenv('X-VTEX-API-AppToken')
 VTEX_ACCOUNT = os.getenv('VTEX_ACCOUNT_NAME')
 VTEX_ENVIRONMENT = os.getenv('VTEX_ENVIRONMENT', 'vtexcommercestable')
 
+logger = logging.getLogger("vtex-specificationgroup-create")
+
+# The input CSV is read through a 1 MiB buffer to cut read() syscalls
+INPUT_BUFFER_SIZE = 1 << 20
+
+# Bytes of input CSV handed to a --parse-workers process per task
+PARSE_CHUNK_SIZE = 16 << 20
+
+
+def setup_logger(log_file=None, verbose=False):
+    """Configure console output (per-row lines only with verbose) and an optional DEBUG log file."""
+    logger.setLevel(logging.DEBUG)
+    logger.handlers.clear()
+
+    ch = logging.StreamHandler(sys.stdout)
+    ch.setLevel(logging.DEBUG if verbose else logging.INFO)
+    ch.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(ch)
+
+    if log_file:
+        fh = logging.FileHandler(log_file, encoding="utf-8")
+        fh.setLevel(logging.DEBUG)
+        fh.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(message)s"))
+        logger.addHandler(fh)
+
+    return logger
+
+
+def dumps_json(obj):
+    """Serialize obj to UTF-8 JSON bytes (orjson is faster when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+loads_json = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def header_seconds(headers, *names):
+    """Return the first of the given headers parsed as seconds, or None.
+
+    Values that look like a Unix timestamp are converted to seconds from now.
+    """
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            seconds = float(value)
+        except ValueError:
+            continue
+        if seconds > 1e9:
+            seconds -= time.time()
+        return max(0.0, seconds)
+    return None
+
+
+def load_created_groups(results_file):
+    """Read the groups a previous run created from its successful output.
+
+    Accepts the successful .jsonl or .csv of this script (and the .json
+    arrays written by older versions). Dry-run rows are ignored.
+
+    Returns:
+        frozenset of (CategoryId, casefolded Name) pairs
+    """
+    created = set()
+
+    if results_file.endswith('.csv'):
+        with open(results_file, 'r', encoding='utf-8-sig', newline='') as f:
+            for row in csv.DictReader(f):
+                if not str(row.get('Id', '')).startswith('SIMULATED-'):
+                    created.add((int(row['CategoryId']), row['Name'].casefold()))
+        return frozenset(created)
+
+    with open(results_file, 'rb') as f:
+        if results_file.endswith('.json'):
+            records = loads_json(f.read())
+        else:
+            records = (loads_json(line) for line in f if line.strip())
+        for record in records:
+            if not str(record.get('group_id', '')).startswith('SIMULATED-'):
+                created.add((int(record['category_id']), record['name'].casefold()))
+    return frozenset(created)
+
+
+def _parse_rows(rows, category_index, name_index, fixed_name):
+    """
+    Validate CSV rows into (CategoryId, Name) pairs.
+
+    Blank rows are skipped. A row whose CategoryId is not an integer comes
+    back as (None, raw value) and an empty name as '', so the caller can
+    report them with their line number.
+    """
+    for row in rows:
+        if not row:
+            continue
+        raw_category_id = row[category_index] if category_index < len(row) else ''
+        try:
+            category_id = int(raw_category_id.strip())
+        except ValueError:
+            yield None, raw_category_id
+            continue
+        if fixed_name is not None:
+            name = fixed_name
+        else:
+            name = row[name_index].strip() if name_index < len(row) else ''
+        yield category_id, name
+
+
+def _parse_chunk(task):
+    """Parse and validate the rows of one byte range of the input CSV."""
+    csv_file, start, end, encoding, category_index, name_index, fixed_name = task
+    with open(csv_file, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode(encoding)
+    rows = csv.reader(io.StringIO(text, newline=''))
+    return list(_parse_rows(rows, category_index, name_index, fixed_name))
+
+
+def _chunk_offsets(f, start, size, chunks):
+    """Split [start, size) into byte ranges that begin and end on line boundaries."""
+    offsets = [start]
+    for k in range(1, chunks):
+        pos = start + (size - start) * k // chunks
+        if pos <= offsets[-1]:
+            continue
+        # Move to the start of the next line (a line starting exactly at pos is kept)
+        f.seek(pos - 1)
+        f.readline()
+        pos = f.tell()
+        if offsets[-1] < pos < size:
+            offsets.append(pos)
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+
+def _parse_csv_parallel(csv_file, data_start, encoding, category_index, name_index, fixed_name, workers):
+    """
+    Yield the validated rows of the input CSV, parsed by a pool of processes.
+
+    The file is cut into byte ranges of about PARSE_CHUNK_SIZE on line
+    boundaries; results come back in file order, one range at a time, so
+    memory stays bounded by a few ranges. Fields must not contain line breaks
+    inside quotes, since a range could start in the middle of a record.
+    """
+    with open(csv_file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        chunks = max(workers, -(-(size - data_start) // PARSE_CHUNK_SIZE))
+        ranges = _chunk_offsets(f, data_start, size, chunks) if size > data_start else []
+
+    tasks = [
+        (csv_file, start, end, encoding, category_index, name_index, fixed_name)
+        for start, end in ranges
+    ]
+    with multiprocessing.Pool(min(workers, len(tasks)) or 1) as pool:
+        for parsed in pool.imap(_parse_chunk, tasks):
+            yield from parsed
+
 
 class VTEXSpecificationGroupCreator:
     """Creates VTEX specification groups via API from CSV data."""
 
-    def __init__(self, delay=1.0, timeout=30, dry_run=False):
+    def __init__(self, delay=1.0, timeout=30, dry_run=False, workers=1, http2=False,
+                 output_prefix="specificationgroup_creation", resume_file=None,
+                 check_categories=False):
         """Initialize the specification group creator.
 
         Args:
             delay: Delay between requests in seconds (default: 1.0)
             timeout: Request timeout in seconds (default: 30)
             dry_run: If True, validate without creating groups (default: False)
+            workers: Number of requests in flight at once (default: 1)
+            http2: If True, send requests over HTTP/2 with httpx (default: False)
+            output_prefix: Prefix for output filenames
+            resume_file: Successful output of a previous run; groups listed
+                there are skipped (default: None)
+            check_categories: If True, look up each CategoryId once before
+                its first POST and fail its rows if VTEX returns 404
         """
         self.delay = delay
         self.timeout = timeout
         self.dry_run = dry_run
+        self.workers = max(1, workers)
+        self.http2 = http2
 
         # Validate credentials
         self.validate_credentials()
 
         # Setup session with authentication headers
-        self.session = requests.Session()
-        self.session.headers.update({
+        headers = {
             'Content-Type': 'application/json',
             'Accept': 'application/json',
             'X-VTEX-API-AppKey': VTEX_APP_KEY,
             'X-VTEX-API-AppToken': VTEX_APP_TOKEN
-        })
+        }
+        if self.http2:
+            # A single HTTP/2 connection carries every worker's requests as
+            # separate streams (same post()/response API as requests)
+            self.session = httpx.Client(http2=True, headers=headers)
+            self._body_arg = 'content'
+        else:
+            self.session = requests.Session()
+            self.session.headers.update(headers)
+            self._body_arg = 'data'
+
+            # One host, one pool with a connection per worker so every request
+            # reuses a kept-alive connection. Retries are handled here, not by urllib3.
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=max(10, self.workers),
+                max_retries=0
+            )
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
 
         # Build API endpoint URL
         self.base_url = f"https://{VTEX_ACCOUNT}.{VTEX_ENVIRONMENT}.com.br"
         self.endpoint = f"{self.base_url}/api/catalog/pvt/specificationgroup"
 
-        # Tracking lists
-        self.successful_groups = []
-        self.failed_groups = []
+        # Results are written to disk as they complete; only the counters
+        # stay in memory. Files are created on their first row.
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.output_base = f"{timestamp}_{output_prefix}"
+        self.success_jsonl = f"{self.output_base}_successful.jsonl"
+        self.success_csv = f"{self.output_base}_successful.csv"
+        self.failed_jsonl = f"{self.output_base}_failed.jsonl"
+        self.failed_csv = f"{self.output_base}_failed.csv"
+        self._success_files = None
+        self._failed_files = None
+
+        # Counters (shared by the worker threads)
+        self.success_count = 0
+        self.failed_count = 0
         self.total_processed = 0
+        self.duplicates_skipped = 0
+        self.resumed_skipped = 0
+
+        # Groups created by a previous run (--resume)
+        self.created_groups = load_created_groups(resume_file) if resume_file else frozenset()
+        self._lock = threading.RLock()
+
+        # CategoryId -> Future with the result of its existence lookup
+        # (--check-categories); rows of the same category share one GET
+        self.check_categories = check_categories
+        self._category_checks = {}
+        self.categories_missing = 0
+
+        # Rate limiting shared by all workers: request starts are kept
+        # `delay` seconds apart no matter how many are in flight
+        self._rate_lock = threading.Lock()
+        self._next_allowed_ts = 0.0
 
         print(f"🔧 Endpoint: {self.endpoint}")
         print(f"⏱️  Delay: {self.delay}s between requests")
         print(f"🕐 Timeout: {self.timeout}s per request")
+        print(f"🧵 Workers: {self.workers}")
+        if self.http2:
+            print("🌐 HTTP/2 enabled (httpx)")
+        if self.check_categories and not self.dry_run:
+            print("🔎 Category check: each CategoryId is looked up once before its first POST")
+        if resume_file:
+            print(f"♻️  Resume: {len(self.created_groups)} groups already created in {resume_file}")
         if self.dry_run:
             print("🧪 DRY-RUN MODE: No groups will be created")
 
@@ -128,16 +389,21 @@ class VTEXSpecificationGroupCreator:
 
         print(f"✅ Credenciales VTEX configuradas para cuenta: {VTEX_ACCOUNT}")
 
-    def load_specification_groups_from_csv(
+    def iter_specification_groups_from_csv(
         self,
         csv_file,
         category_column='CategoryId',
         name_column='Name',
         fixed_name=None,
         encoding='utf-8-sig',
-        deduplicate=True
+        deduplicate=True,
+        parse_workers=1
     ):
-        """Load specification group data from CSV file.
+        """Read specification group data from CSV file, one row at a time.
+
+        Rows are yielded as soon as they are validated, so requests can start
+        before the whole file is read. Header errors are raised on the first
+        next() call.
 
         Args:
             csv_file: Path to CSV file
@@ -145,18 +411,34 @@ class VTEXSpecificationGroupCreator:
             name_column: Column name containing the specification group name
             fixed_name: Fixed specification group name to use for every row
             encoding: CSV file encoding
-            deduplicate: If True, process each CategoryId only once
+            deduplicate: If True, process each CategoryId only once; if False,
+                still skip repeated (CategoryId, Name) pairs, ignoring case
+            parse_workers: Processes used to parse and validate rows; with
+                more than 1 the file is split into line-aligned byte ranges
 
-        Returns:
-            List of dictionaries with CategoryId and Name
+        Yields:
+            Dictionaries with CategoryId, Name and line_number
         """
-        groups = []
+        count = 0
         seen_category_ids = set()
+        seen_groups = set()
         fixed_name_value = fixed_name.strip() if fixed_name is not None else None
 
-        with open(csv_file, 'r', encoding=encoding, newline='') as f:
-            reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames or []
+        with contextlib.ExitStack() as stack:
+            if parse_workers > 1:
+                with open(csv_file, 'rb') as f:
+                    header_line = f.readline()
+                    data_start = f.tell()
+                fieldnames = next(csv.reader([header_line.decode(encoding)]), [])
+            else:
+                f = stack.enter_context(
+                    open(csv_file, 'r', encoding=encoding, newline='', buffering=INPUT_BUFFER_SIZE)
+                )
+                reader = csv.reader(f)
+                fieldnames = next(reader, [])
+            # Column positions, resolved once (a repeated header name maps to
+            # its last column, as csv.DictReader would)
+            positions = {column: index for index, column in enumerate(fieldnames)}
 
             # Validate headers
             if category_column not in fieldnames:
@@ -170,41 +452,182 @@ class VTEXSpecificationGroupCreator:
                     f"Found: {fieldnames}"
                 )
 
-            for i, row in enumerate(reader, start=2):  # start=2 (line 1 is header)
-                # Validate CategoryId
-                raw_category_id = row.get(category_column) or ''
-                try:
-                    category_id = int(raw_category_id.strip())
-                except ValueError:
-                    print(f"⚠️  Line {i}: Invalid {category_column} '{raw_category_id}' - skipping")
+            category_index = positions[category_column]
+            name_index = positions.get(name_column)
+
+            if parse_workers > 1:
+                parsed = _parse_csv_parallel(csv_file, data_start, encoding, category_index,
+                                             name_index, fixed_name_value, parse_workers)
+            else:
+                parsed = _parse_rows(reader, category_index, name_index, fixed_name_value)
+
+            for i, (category_id, name) in enumerate(parsed, start=2):  # start=2 (line 1 is header)
+                if category_id is None:
+                    logger.warning("⚠️  Line %d: Invalid %s '%s' - skipping", i, category_column, name)
                     continue
 
                 if deduplicate and category_id in seen_category_ids:
-                    print(f"⚠️  Line {i}: Duplicate CategoryId '{category_id}' - skipping")
+                    logger.debug("⚠️  Line %d: Duplicate CategoryId '%s' - skipping", i, category_id)
+                    self.duplicates_skipped += 1
                     continue
 
-                # Validate Name
-                name = fixed_name_value if fixed_name_value is not None else (row.get(name_column) or '').strip()
                 if not name:
-                    print(f"⚠️  Line {i}: Empty Name - skipping")
+                    logger.warning("⚠️  Line %d: Empty Name - skipping", i)
                     continue
 
-                seen_category_ids.add(category_id)
-                groups.append({
+                # Remember the row; with --no-deduplicate the same name twice in
+                # one category would only create noise
+                if deduplicate:
+                    seen_category_ids.add(category_id)
+                else:
+                    group_key = (category_id, name.casefold())
+                    if group_key in seen_groups:
+                        logger.debug("⚠️  Line %d: Duplicate group '%s' for CategoryId '%s' - skipping", i, name, category_id)
+                        self.duplicates_skipped += 1
+                        continue
+                    seen_groups.add(group_key)
+
+                if (category_id, name.casefold()) in self.created_groups:
+                    logger.debug("♻️  Line %d: '%s' for CategoryId '%s' already created - skipping", i, name, category_id)
+                    self.resumed_skipped += 1
+                    continue
+                count += 1
+                yield {
                     'CategoryId': category_id,
                     'Name': name,
                     'line_number': i
-                })
+                }
+
+        print(f"✅ Read {count} specification groups from CSV")
+
+    def _wait_for_rate_limit(self):
+        """Block until this worker may start its next request."""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait_time = self._next_allowed_ts - now
+            self._next_allowed_ts = max(now, self._next_allowed_ts) + self.delay
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    def _apply_rate_limit_headers(self, response):
+        """Delay the next request start if the server says the limit is used up.
+
+        Returns:
+            Seconds the server asked to wait, or None if it gave no hint
+        """
+        headers = response.headers
+        wait_time = header_seconds(headers, 'Retry-After')
+        if wait_time is None:
+            remaining = header_seconds(headers, 'X-RateLimit-Remaining')
+            if response.status_code == 429 or (remaining is not None and remaining <= 1):
+                wait_time = header_seconds(
+                    headers,
+                    'X-RateLimit-Reset-After',
+                    'X-VTEX-Ratelimit-Reset',
+                    'X-RateLimit-Reset'
+                )
+
+        if wait_time:
+            with self._rate_lock:
+                self._next_allowed_ts = max(self._next_allowed_ts, time.monotonic() + wait_time)
+        return wait_time
+
+    @staticmethod
+    def _open_result_files(jsonl_path, csv_path, fieldnames):
+        jsonl_file = open(jsonl_path, 'wb')
+        csv_file = open(csv_path, 'w', encoding='utf-8', newline='')
+        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+        writer.writeheader()
+        return jsonl_file, csv_file, writer
+
+    @staticmethod
+    def _write_result(files, result, csv_row):
+        jsonl_file, csv_file, writer = files
+        jsonl_file.write(dumps_json(result) + b'\n')
+        writer.writerow(csv_row)
+        # Flush per row so an interrupted run keeps every finished result
+        jsonl_file.flush()
+        csv_file.flush()
+
+    def _record_success(self, result):
+        with self._lock:
+            if self._success_files is None:
+                self._success_files = self._open_result_files(
+                    self.success_jsonl,
+                    self.success_csv,
+                    ['Id', 'GroupId', 'CategoryId', 'Name', 'Position', 'StatusCode']
+                )
+            group_id = result.get('group_id', 'N/A')
+            self._write_result(self._success_files, result, {
+                'Id': group_id,
+                'GroupId': group_id,
+                'CategoryId': result['category_id'],
+                'Name': result['name'],
+                'Position': result.get('position', 'N/A'),
+                'StatusCode': result.get('status_code', 'N/A')
+            })
+            self.success_count += 1
+            self.total_processed += 1
+
+    def _record_failure(self, error_result):
+        with self._lock:
+            if self._failed_files is None:
+                self._failed_files = self._open_result_files(
+                    self.failed_jsonl,
+                    self.failed_csv,
+                    ['CategoryId', 'Name', 'Error', 'StatusCode']
+                )
+            self._write_result(self._failed_files, error_result, {
+                'CategoryId': error_result['group_data']['CategoryId'],
+                'Name': error_result['group_data']['Name'],
+                'Error': error_result.get('error', 'Unknown error'),
+                'StatusCode': error_result.get('status_code', 'N/A')
+            })
+            self.failed_count += 1
+
+    def _category_exists(self, category_id):
+        """Return False if VTEX answers 404 for the category, True otherwise.
 
-        print(f"✅ Loaded {len(groups)} specification groups from CSV")
-        return groups
+        Each CategoryId is looked up once; concurrent rows of the same
+        category wait for that lookup. A failed lookup counts as existing,
+        so the POST still runs and reports the real error.
+        """
+        with self._lock:
+            check = self._category_checks.get(category_id)
+            if check is None:
+                check = self._category_checks[category_id] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return check.result()
 
-    def create_specification_group(self, group_data, retry_count=0):
+        exists = True
+        try:
+            self._wait_for_rate_limit()
+            response = self.session.get(
+                f"{self.base_url}/api/catalog_system/pvt/category/{category_id}",
+                timeout=self.timeout
+            )
+            self._apply_rate_limit_headers(response)
+            exists = response.status_code != 404
+        except REQUEST_ERRORS:
+            pass
+        finally:
+            check.set_result(exists)
+
+        if not exists:
+            with self._lock:
+                self.categories_missing += 1
+        return exists
+
+    def create_specification_group(self, group_data):
         """Create a specification group in VTEX.
 
+        Rate limited (429) requests are retried up to MAX_RETRIES times.
+
         Args:
             group_data: Dictionary with CategoryId and Name
-            retry_count: Current retry count (for exponential backoff)
 
         Returns:
             True if successful, False otherwise
@@ -219,245 +642,255 @@ class VTEXSpecificationGroupCreator:
             'Name': name
         }
 
-        # Apply rate limiting (except on retries)
-        if not self.dry_run and self.total_processed > 0 and retry_count == 0:
-            time.sleep(self.delay)
-
         # Dry-run mode
         if self.dry_run:
-            print(f"  [DRY-RUN] Would create: CategoryId={category_id}, Name='{name}'")
-            # Simulate a response similar to what the API would return
-            simulated_group_id = f"SIMULATED-{self.total_processed + 1}"
-            self.successful_groups.append({
+            logger.debug("  [DRY-RUN] Would create: CategoryId=%s, Name='%s'", category_id, name)
+            with self._lock:
+                position = self.total_processed + 1
+                # Simulate a response similar to what the API would return
+                simulated_group_id = f"SIMULATED-{position}"
+                self._record_success({
+                    'group_data': group_data,
+                    'response_id': simulated_group_id,
+                    'payload': payload,
+                    'status_code': 200,
+                    'category_id': category_id,
+                    'name': name,
+                    'group_id': simulated_group_id,
+                    'position': position,
+                    'timestamp': datetime.now().isoformat()
+                })
+            return True
+
+        if self.check_categories and not self._category_exists(category_id):
+            self._record_failure({
                 'group_data': group_data,
-                'response': {
-                    'Id': simulated_group_id,
-                    'CategoryId': category_id,
-                    'Name': name,
-                    'Position': self.total_processed + 1,
-                    'message': 'DRY-RUN mode'
-                },
-                'payload': payload,
-                'status_code': 200,
+                'error': f'Category {category_id} not found in VTEX (category check)',
+                'status_code': 404,
                 'category_id': category_id,
                 'name': name,
-                'group_id': simulated_group_id,
-                'position': self.total_processed + 1,
                 'timestamp': datetime.now().isoformat()
             })
-            self.total_processed += 1
-            return True
+            logger.warning("  ❌ Failed: %s - Category %s not found", name, category_id)
+            return False
 
-        try:
-            response = self.session.post(
-                self.endpoint,
-                json=payload,
-                timeout=self.timeout
-            )
+        body = dumps_json(payload)
 
-            # Success
-            if response.status_code in [200, 201]:
-                response_data = response.json() if response.text else {}
-                group_id = response_data.get('Id', 'N/A')
+        # Apply rate limiting (retries wait on the 429 hint instead)
+        self._wait_for_rate_limit()
 
-                result = {
-                    'group_data': group_data,
-                    'response': response_data,
-                    'payload': payload,
-                    'status_code': response.status_code,
-                    'category_id': category_id,
-                    'name': name,
-                    'group_id': group_id,
-                    'position': response_data.get('Position', 'N/A'),
-                    'timestamp': datetime.now().isoformat()
-                }
-                self.successful_groups.append(result)
-                self.total_processed += 1
-                print(f"  ✅ Created: {name} (CategoryId: {category_id}, GroupId: {group_id})")
-                return True
-
-            # Rate limit - retry with exponential backoff
-            elif response.status_code == 429:
-                if retry_count < MAX_RETRIES:
-                    wait_time = self.delay * (BACKOFF_FACTOR ** retry_count)
-                    print(f"  ⚠️  Rate limit. Waiting {wait_time}s... (retry {retry_count+1}/{MAX_RETRIES})")
+        for retry_count in range(MAX_RETRIES + 1):
+            try:
+                # Pre-serialized body: requests takes raw bytes as data=,
+                # httpx as content= (Content-Type is set on the session)
+                response = self.session.post(
+                    self.endpoint,
+                    timeout=self.timeout,
+                    **{self._body_arg: body}
+                )
+                server_wait = self._apply_rate_limit_headers(response)
+
+                # Success
+                if response.status_code in [200, 201]:
+                    response_data = loads_json(response.content) if response.content else {}
+                    group_id = response_data.get('Id', 'N/A')
+
+                    # The ISO timestamp costs ~2 µs per row against a round trip of
+                    # tens of ms, and rows go to the JSONL right away, so it is
+                    # formatted here rather than kept as a raw time.time() value.
+                    # Only the response fields that are exported are kept.
+                    result = {
+                        'group_data': group_data,
+                        'response_id': group_id,
+                        'payload': payload,
+                        'status_code': response.status_code,
+                        'category_id': category_id,
+                        'name': name,
+                        'group_id': group_id,
+                        'position': response_data.get('Position', 'N/A'),
+                        'timestamp': datetime.now().isoformat()
+                    }
+                    self._record_success(result)
+                    logger.debug("  ✅ Created: %s (CategoryId: %s, GroupId: %s)", name, category_id, group_id)
+                    return True
+
+                # Rate limit - retry after the server's Retry-After/reset hint,
+                # or with exponential backoff when there is none
+                elif response.status_code == 429:
+                    if retry_count == MAX_RETRIES:
+                        break
+                    if server_wait is not None:
+                        wait_time = server_wait
+                    else:
+                        wait_time = self.delay * (BACKOFF_FACTOR ** retry_count)
+                    logger.info("  ⚠️  Rate limit. Waiting %ss... (retry %d/%d)", wait_time, retry_count + 1, MAX_RETRIES)
                     time.sleep(wait_time)
-                    return self.create_specification_group(group_data, retry_count + 1)
+
+                # Other errors
                 else:
+                    error_text = response.text if response.text else 'No error message'
                     error_result = {
                         'group_data': group_data,
-                        'error': 'Rate limit exceeded - max retries reached',
-                        'status_code': 429,
+                        'error': error_text,
+                        'status_code': response.status_code,
+                        'category_id': category_id,
+                        'name': name,
                         'timestamp': datetime.now().isoformat()
                     }
-                    self.failed_groups.append(error_result)
-                    print(f"  ❌ Failed: {name} - Rate limit exceeded")
+                    self._record_failure(error_result)
+                    logger.warning("  ❌ Failed: %s - Status %s", name, response.status_code)
                     return False
 
-            # Other errors
-            else:
-                error_text = response.text if response.text else 'No error message'
+            except TIMEOUT_ERRORS:
                 error_result = {
                     'group_data': group_data,
-                    'error': error_text,
-                    'status_code': response.status_code,
+                    'error': f'Request timeout after {self.timeout}s',
                     'category_id': category_id,
                     'name': name,
                     'timestamp': datetime.now().isoformat()
                 }
-                self.failed_groups.append(error_result)
-                print(f"  ❌ Failed: {name} - Status {response.status_code}")
+                self._record_failure(error_result)
+                logger.warning("  ❌ Failed: %s - Timeout", name)
                 return False
 
-        except requests.exceptions.Timeout:
-            error_result = {
-                'group_data': group_data,
-                'error': f'Request timeout after {self.timeout}s',
-                'category_id': category_id,
-                'name': name,
-                'timestamp': datetime.now().isoformat()
-            }
-            self.failed_groups.append(error_result)
-            print(f"  ❌ Failed: {name} - Timeout")
-            return False
+            except REQUEST_ERRORS as e:
+                error_result = {
+                    'group_data': group_data,
+                    'error': f'Request error: {str(e)}',
+                    'category_id': category_id,
+                    'name': name,
+                    'timestamp': datetime.now().isoformat()
+                }
+                self._record_failure(error_result)
+                logger.warning("  ❌ Failed: %s - %s", name, e)
+                return False
 
-        except requests.exceptions.RequestException as e:
-            error_result = {
-                'group_data': group_data,
-                'error': f'Request error: {str(e)}',
-                'category_id': category_id,
-                'name': name,
-                'timestamp': datetime.now().isoformat()
-            }
-            self.failed_groups.append(error_result)
-            print(f"  ❌ Failed: {name} - {str(e)}")
-            return False
+        error_result = {
+            'group_data': group_data,
+            'error': 'Rate limit exceeded - max retries reached',
+            'status_code': 429,
+            'timestamp': datetime.now().isoformat()
+        }
+        self._record_failure(error_result)
+        logger.warning("  ❌ Failed: %s - Rate limit exceeded", name)
+        return False
 
     def process_all_groups(self, groups):
         """Process all specification groups.
 
         Args:
-            groups: List of group dictionaries
+            groups: Iterable of group dictionaries (consumed lazily)
         """
-        total = len(groups)
         print(f"\n{'='*70}")
-        print(f"Processing {total} specification groups...")
+        print("Processing specification groups...")
         print(f"{'='*70}\n")
 
-        start_time = time.time()
-
-        for i, group in enumerate(groups, 1):
-            print(f"[{i}/{total}] CategoryId: {group['CategoryId']}, Name: '{group['Name']}'")
-            self.create_specification_group(group)
-
-            # Progress report every 10 items
-            if i % 10 == 0:
-                elapsed = time.time() - start_time
-                avg_time = elapsed / i
-                remaining = (total - i) * avg_time
-                print(f"\n📊 Progress: {i}/{total} - Successful: {len(self.successful_groups)}, Failed: {len(self.failed_groups)}")
-                print(f"⏱️  Elapsed: {elapsed:.1f}s, Estimated remaining: {remaining:.1f}s\n")
-
-        duration = time.time() - start_time
+        start_time = time.monotonic()
+        completed = 0
+
+        def collect(done):
+            nonlocal completed
+            for future in done:
+                future.result()  # re-raise unexpected errors from the worker
+                completed += 1
+
+                # Progress report every 10 items
+                if completed % 10 == 0:
+                    elapsed = time.monotonic() - start_time
+                    rate = completed / elapsed if elapsed > 0 else 0
+                    print(f"\n📊 Progress: {completed} processed - Successful: {self.success_count}, Failed: {self.failed_count}")
+                    print(f"⏱️  Elapsed: {elapsed:.1f}s, Rate: {rate:.1f} groups/s\n")
+
+        # Keep at most `workers` requests in flight; the shared rate limit
+        # still spaces their start times by `delay`
+        in_flight = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for i, group in enumerate(groups, 1):
+                if len(in_flight) >= self.workers:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+                logger.debug("[%d] CategoryId: %s, Name: '%s'", i, group['CategoryId'], group['Name'])
+                in_flight.add(executor.submit(self.create_specification_group, group))
+            collect(wait(in_flight).done)
+
+        duration = time.monotonic() - start_time
         print(f"\n{'='*70}")
         print(f"✅ Processing complete!")
         print(f"⏱️  Total duration: {duration:.1f}s ({duration/60:.1f} minutes)")
         print(f"{'='*70}\n")
 
-    def export_results(self, output_prefix="specificationgroup_creation"):
-        """Export successful and failed results to JSON and CSV files.
-
-        Args:
-            output_prefix: Prefix for output filenames
-        """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-        if self.successful_groups:
-            success_file = f"{timestamp}_{output_prefix}_successful.json"
-            with open(success_file, 'w', encoding='utf-8') as f:
-                json.dump(self.successful_groups, f, ensure_ascii=False, indent=2)
-            print(f"✅ Successful groups exported to: {success_file}")
-
-            # Also export successful as CSV with Id/GroupId for easy reference
-            success_csv = f"{timestamp}_{output_prefix}_successful.csv"
-            with open(success_csv, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=['Id', 'GroupId', 'CategoryId', 'Name', 'Position', 'StatusCode']
-                )
-                writer.writeheader()
-                for item in self.successful_groups:
-                    group_id = item.get('group_id', 'N/A')
-                    writer.writerow({
-                        'Id': group_id,
-                        'GroupId': group_id,
-                        'CategoryId': item['category_id'],
-                        'Name': item['name'],
-                        'Position': item.get('position', 'N/A'),
-                        'StatusCode': item.get('status_code', 'N/A')
-                    })
-            print(f"✅ Successful groups CSV exported to: {success_csv}")
-
-        if self.failed_groups:
-            failed_file = f"{timestamp}_{output_prefix}_failed.json"
-            with open(failed_file, 'w', encoding='utf-8') as f:
-                json.dump(self.failed_groups, f, ensure_ascii=False, indent=2)
-            print(f"❌ Failed groups exported to: {failed_file}")
-
-            # Also export failed as CSV for easy review
-            failed_csv = f"{timestamp}_{output_prefix}_failed.csv"
-            with open(failed_csv, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=['CategoryId', 'Name', 'Error', 'StatusCode'])
-                writer.writeheader()
-                for item in self.failed_groups:
-                    writer.writerow({
-                        'CategoryId': item['group_data']['CategoryId'],
-                        'Name': item['group_data']['Name'],
-                        'Error': item.get('error', 'Unknown error'),
-                        'StatusCode': item.get('status_code', 'N/A')
-                    })
-            print(f"❌ Failed groups CSV exported to: {failed_csv}")
+    def export_results(self):
+        """Close the JSONL and CSV result files written during processing."""
+        if self._success_files is not None:
+            jsonl_file, csv_file, _ = self._success_files
+            jsonl_file.close()
+            csv_file.close()
+            print(f"✅ Successful groups exported to: {self.success_jsonl}")
+            print(f"✅ Successful groups CSV exported to: {self.success_csv}")
+
+        if self._failed_files is not None:
+            jsonl_file, csv_file, _ = self._failed_files
+            jsonl_file.close()
+            csv_file.close()
+            print(f"❌ Failed groups exported to: {self.failed_jsonl}")
+            print(f"❌ Failed groups CSV exported to: {self.failed_csv}")
+
+    @staticmethod
+    def _read_results(jsonl_path, limit=None):
+        """Yield up to `limit` result dicts from a JSONL results file."""
+        if not os.path.exists(jsonl_path):
+            return
+        with open(jsonl_path, 'r', encoding='utf-8') as f:
+            for line in itertools.islice(f, limit):
+                yield loads_json(line)
 
     def _format_successful_table(self):
         """Format successful groups as markdown table."""
-        if not self.successful_groups:
+        if not self.success_count:
             return "_No successful creations_"
 
-        table = "| CategoryId | Name | GroupId | Position | Timestamp |\n"
-        table += "|------------|------|---------|----------|------------|\n"
+        parts = [
+            "| CategoryId | Name | GroupId | Position | Timestamp |\n",
+            "|------------|------|---------|----------|------------|\n",
+        ]
 
-        for item in self.successful_groups[:20]:  # Limit to 20 entries
+        for item in self._read_results(self.success_jsonl, 20):  # Limit to 20 entries
             group_id = item.get('group_id', 'N/A')
             position = item.get('position', 'N/A')
-            table += f"| {item['category_id']} | {item['name']} | {group_id} | {position} | {item['timestamp']} |\n"
+            parts.append(f"| {item['category_id']} | {item['name']} | {group_id} | {position} | {item['timestamp']} |\n")
 
-        if len(self.successful_groups) > 20:
-            table += f"\n_... and {len(self.successful_groups) - 20} more_\n"
+        if self.success_count > 20:
+            parts.append(f"\n_... and {self.success_count - 20} more_\n")
 
-        return table
+        return "".join(parts)
 
     def _format_failed_table(self):
         """Format failed groups as markdown table."""
-        if not self.failed_groups:
+        if not self.failed_count:
             return "_No failures_"
 
-        table = "| CategoryId | Name | Error | Status Code |\n"
-        table += "|------------|------|-------|-------------|\n"
+        parts = [
+            "| CategoryId | Name | Error | Status Code |\n",
+            "|------------|------|-------|-------------|\n",
+        ]
 
-        for item in self.failed_groups:
+        for item in self._read_results(self.failed_jsonl, 100):  # Limit to 100 entries
             error = item.get('error', 'Unknown error')
             # Truncate long errors
             if len(error) > 50:
                 error = error[:47] + "..."
-            table += f"| {item['group_data']['CategoryId']} | {item['group_data']['Name']} | {error} | {item.get('status_code', 'N/A')} |\n"
+            parts.append(f"| {item['group_data']['CategoryId']} | {item['group_data']['Name']} | {error} | {item.get('status_code', 'N/A')} |\n")
+
+        if self.failed_count > 100:
+            parts.append(f"\n_... and {self.failed_count - 100} more (see {self.failed_csv})_\n")
 
-        return table
+        return "".join(parts)
 
     def _generate_recommendations(self):
         """Generate recommendations based on results."""
         recommendations = []
 
-        if not self.failed_groups:
+        if not self.failed_count:
             recommendations.append("✅ All specification groups were created successfully!")
             recommendations.append("- No further action required")
         else:
@@ -465,6 +898,8 @@ class VTEXSpecificationGroupCreator:
             recommendations.append(f"- Review the failed groups in the CSV export")
             recommendations.append(f"- Check error messages for common patterns")
             recommendations.append(f"- Verify CategoryId values exist in VTEX")
+            if self.categories_missing:
+                recommendations.append(f"- {self.categories_missing} CategoryId values were not found in VTEX (--check-categories)")
             recommendations.append(f"- Fix errors and re-run with failed groups CSV")
 
         return "\n".join(recommendations)
@@ -477,9 +912,9 @@ class VTEXSpecificationGroupCreator:
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        total = len(self.successful_groups) + len(self.failed_groups)
-        success_count = len(self.successful_groups)
-        failed_count = len(self.failed_groups)
+        total = self.success_count + self.failed_count
+        success_count = self.success_count
+        failed_count = self.failed_count
         success_rate = (success_count / total * 100) if total > 0 else 0
 
         report = f"""# VTEX Specification Group Creation Report
@@ -496,6 +931,8 @@ class VTEXSpecificationGroupCreator:
 | **Total Processed** | {total} |
 | **✅ Successful** | {success_count} ({success_rate:.1f}%) |
 | **❌ Failed** | {failed_count} ({100-success_rate:.1f}%) |
+| **Duplicate rows skipped** | {self.duplicates_skipped} |
+| **Already created (resume)** | {self.resumed_skipped} |
 
 ## Successful Creations
 
@@ -534,6 +971,16 @@ Examples:
   # Custom delay and timeout
   python3 vtex_specificationgroup_create.py groups.csv --delay 2.0 --timeout 60
 
+  # 8 requests in flight, at most 10 request starts per second
+  python3 vtex_specificationgroup_create.py groups.csv --workers 8 --delay 0.1
+
+  # Re-run skipping the groups a previous run already created
+  python3 vtex_specificationgroup_create.py groups.csv \\
+    --resume 20260101_120000_specificationgroup_creation_successful.jsonl
+
+  # Same, multiplexed over one HTTP/2 connection (pip install "httpx[http2]")
+  python3 vtex_specificationgroup_create.py groups.csv --workers 8 --delay 0.1 --http2
+
   # Step 61 category IDs with a fixed SKU specification group name
   python3 31_vtex_specificationgroup_create/vtex_specificationgroup_create.py 61_sku_spec_matcher/resultado_20260601_214458_category_ids.csv \\
     --category-id-column "Category ID" --fixed-name "Especificaciones (SKU)" \\
@@ -551,9 +998,9 @@ Step 61 CSV Format:
   1528
 
 Output Files:
-  - YYYYMMDD_HHMMSS_specificationgroup_creation_successful.json (full API responses)
+  - YYYYMMDD_HHMMSS_specificationgroup_creation_successful.jsonl (created groups)
   - YYYYMMDD_HHMMSS_specificationgroup_creation_successful.csv (Id/GroupId reference)
-  - YYYYMMDD_HHMMSS_specificationgroup_creation_failed.json (error details)
+  - YYYYMMDD_HHMMSS_specificationgroup_creation_failed.jsonl (error details)
   - YYYYMMDD_HHMMSS_specificationgroup_creation_failed.csv (errors for review)
   - YYYYMMDD_HHMMSS_specificationgroup_creation_REPORT.md (full report)
         '''
@@ -562,6 +1009,10 @@ Output Files:
     parser.add_argument('input_csv', help='CSV file with configurable category ID and name columns')
     parser.add_argument('--delay', type=float, default=1.0,
                        help='Delay between requests in seconds (default: 1.0)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Concurrent requests in flight; --delay still spaces their starts (default: 1)')
+    parser.add_argument('--http2', action='store_true',
+                       help='Send requests over a single HTTP/2 connection (requires httpx[http2])')
     parser.add_argument('--timeout', type=int, default=30,
                        help='Request timeout in seconds (default: 30)')
     parser.add_argument('--output-prefix', default='specificationgroup_creation',
@@ -575,48 +1026,84 @@ Output Files:
     parser.add_argument('--encoding', default='utf-8-sig',
                        help='CSV file encoding (default: utf-8-sig)')
     parser.add_argument('--no-deduplicate', action='store_true',
-                       help='Process duplicate category IDs instead of skipping repeats')
+                       help='Process duplicate category IDs instead of skipping repeats '
+                            '(rows repeating the same CategoryId and Name are still skipped)')
+    parser.add_argument('--parse-workers', type=int, default=1,
+                       help='Processes used to parse and validate very large CSVs (default: 1); '
+                            'fields must not contain line breaks')
+    parser.add_argument('--resume', default=None, metavar='SUCCESSFUL_FILE',
+                       help='Successful .jsonl or .csv from a previous run; groups listed there are skipped')
+    parser.add_argument('--check-categories', action='store_true',
+                       help='Look up each CategoryId once (GET) before its first POST; rows whose '
+                            'category returns 404 fail without a POST')
     parser.add_argument('--dry-run', action='store_true',
                        help='Simulation mode: validate data without creating groups')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Print one line per row (created, skipped, submitted) on the console')
+    parser.add_argument('--log-file', default=None,
+                       help='Write every per-row line, with timestamps, to this log file')
 
     args = parser.parse_args()
+    setup_logger(args.log_file, args.verbose)
 
     # Validate CSV file exists
     if not os.path.exists(args.input_csv):
         print(f"Error: CSV file not found - {args.input_csv}")
         sys.exit(1)
 
+    if args.resume and not os.path.exists(args.resume):
+        print(f"Error: resume file not found - {args.resume}")
+        sys.exit(1)
+
+    if args.parse_workers < 1:
+        print("Error: --parse-workers must be at least 1")
+        sys.exit(1)
+
+    if args.http2 and not HTTPX_AVAILABLE:
+        print('Error: --http2 requires httpx with HTTP/2 support. Install it with: pip install "httpx[http2]"')
+        sys.exit(1)
+
     try:
         # Initialize creator
         creator = VTEXSpecificationGroupCreator(
             delay=args.delay,
             timeout=args.timeout,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            workers=args.workers,
+            http2=args.http2,
+            output_prefix=args.output_prefix,
+            resume_file=args.resume,
+            check_categories=args.check_categories
         )
 
-        # Load groups from CSV
-        groups = creator.load_specification_groups_from_csv(
+        # Stream groups from CSV
+        groups = creator.iter_specification_groups_from_csv(
             args.input_csv,
             category_column=args.category_id_column,
             name_column=args.name_column,
             fixed_name=args.fixed_name,
             encoding=args.encoding,
-            deduplicate=not args.no_deduplicate
+            deduplicate=not args.no_deduplicate,
+            parse_workers=args.parse_workers
         )
 
-        if not groups:
+        # Peek at the first row so an empty file still exits early
+        first_group = next(groups, None)
+        if first_group is None:
+            if creator.resumed_skipped:
+                print("✅ Every group in the CSV was already created - nothing to do")
+                sys.exit(0)
             print("No valid groups found in CSV file")
             sys.exit(1)
 
         # Process all groups
-        creator.process_all_groups(groups)
+        creator.process_all_groups(itertools.chain([first_group], groups))
 
         # Export results
-        creator.export_results(args.output_prefix)
+        creator.export_results()
 
         # Generate report
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_file = f"{timestamp}_{args.output_prefix}_REPORT.md"
+        report_file = f"{creator.output_base}_REPORT.md"
         creator.generate_markdown_report(report_file)
 
         # Final statistics
@@ -624,12 +1111,14 @@ Output Files:
         print(f"FINAL STATISTICS")
         print(f"{'='*70}")
         print(f"Total processed:  {creator.total_processed}")
-        print(f"✅ Successful:    {len(creator.successful_groups)}")
-        print(f"❌ Failed:        {len(creator.failed_groups)}")
+        print(f"✅ Successful:    {creator.success_count}")
+        print(f"❌ Failed:        {creator.failed_count}")
+        print(f"Duplicates skipped: {creator.duplicates_skipped}")
+        print(f"Already created:    {creator.resumed_skipped}")
         print(f"{'='*70}\n")
 
         # Exit code based on results
-        if creator.failed_groups:
+        if creator.failed_count:
             sys.exit(1)
         else:
             sys.exit(0)
@@ -19,35 +19,64 @@ import json
 import os
 import sys
 from datetime import datetime
+from itertools import chain, count
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
-def load_file(file_path):
-    """Load JSON or CSV file based on extension."""
+# Parse errors reported as invalid JSON (ijson has its own exception type)
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if IJSON_AVAILABLE else (json.JSONDecodeError,)
+
+
+def iter_file(file_path):
+    """Return an iterator over the records of a JSON or CSV file, based on extension.
+
+    The path and extension are checked right away; records are read as
+    they are consumed.
+    """
     if not os.path.exists(file_path):
         print(f"❌ Error: El archivo '{file_path}' no existe")
         sys.exit(1)
 
     ext = os.path.splitext(file_path)[1].lower()
+    if ext != '.json' and ext not in ['.csv', '.xls', '.xlsx']:
+        print(f"❌ Error: Extensión '{ext}' no soportada. Use .json o .csv")
+        sys.exit(1)
 
+    return _iter_records(file_path, ext)
+
+
+def _iter_records(file_path, ext):
+    """Yield records one at a time (a JSON array is streamed with ijson when installed)."""
     try:
         if ext == '.json':
+            if IJSON_AVAILABLE:
+                with open(file_path, 'rb') as f:
+                    # use_float keeps numbers as json.load returns them
+                    events = ijson.parse(f, use_float=True)
+                    # ijson.items finds no records in a top-level object, so
+                    # the first event must open the list
+                    first = next(events)
+                    if first[1] != 'start_array':
+                        print(f"❌ Error: El archivo debe contener una lista de registros")
+                        sys.exit(1)
+                    yield from ijson.items(chain((first,), events), 'item')
+                return
+
             with open(file_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-        elif ext in ['.csv', '.xls', '.xlsx']:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                data = [row for row in reader]
+            if not isinstance(data, list):
+                print(f"❌ Error: El archivo debe contener una lista de registros")
+                sys.exit(1)
+            yield from data
         else:
-            print(f"❌ Error: Extensión '{ext}' no soportada. Use .json o .csv")
-            sys.exit(1)
-
-        if not isinstance(data, list):
-            print(f"❌ Error: El archivo debe contener una lista de registros")
-            sys.exit(1)
-
-        return data
+            with open(file_path, 'r', encoding='utf-8') as f:
+                yield from csv.DictReader(f)
 
-    except json.JSONDecodeError as e:
+    except JSON_ERRORS as e:
         print(f"❌ Error: JSON inválido en '{file_path}': {e}")
         sys.exit(1)
     except Exception as e:
@@ -62,16 +91,19 @@ def clean_value(value):
     return str(value).strip()
 
 
-def build_mapping(mapping_data):
-    """Build dictionary mapping _SKUReferenceCode -> _ProductId."""
-    mapping = {}
+def build_mapping(mapping_rows):
+    """Build dictionary mapping _SKUReferenceCode -> _ProductId in one pass.
 
+    Returns:
+        tuple: (mapping dict, number of records read)
+    """
     # Check for required field
-    if not mapping_data:
+    rows = iter(mapping_rows)
+    sample = next(rows, None)
+    if sample is None:
         print("❌ Error: El archivo de mapeo está vacío")
         sys.exit(1)
 
-    sample = mapping_data[0]
     if '_SKUReferenceCode' not in sample:
         print(f"❌ Error: Campo '_SKUReferenceCode' no encontrado en archivo de mapeo")
         print(f"   Campos disponibles: {list(sample.keys())}")
@@ -82,72 +114,102 @@ def build_mapping(mapping_data):
         print(f"   Campos disponibles: {list(sample.keys())}")
         sys.exit(1)
 
-    for item in mapping_data:
-        ref_code = clean_value(item.get('_SKUReferenceCode'))
-        product_id = clean_value(item.get('_ProductId'))
-
-        if ref_code and ref_code != 'None':
-            mapping[ref_code] = product_id
-
-    return mapping
-
+    # clean_value inlined: str(None) is 'None', which is skipped anyway, and
+    # _ProductId is only cleaned for rows that are kept. zip stops on the rows
+    # before taking a number, so the counter ends one past the rows read.
+    counter = count(1)
+    mapping = {
+        ref_code: '' if product_id is None else str(product_id).strip()
+        for item, _ in zip(chain((sample,), rows), counter)
+        for ref_code in (str(item.get('_SKUReferenceCode')).strip(),)
+        if ref_code and ref_code != 'None'
+        for product_id in (item.get('_ProductId'),)
+    }
 
-def process_data(data, mapping):
-    """Process data file and add _ProductId from mapping."""
-    if not data:
+    return mapping, next(counter) - 1
+
+
+class CsvExport:
+    """CSV output whose columns are the keys of the first row written.
+
+    The file is only created when that first row arrives.
+    """
+
+    def __init__(self, output_path, first_column=None):
+        self.output_path = output_path
+        self.first_column = first_column
+        self._file = None
+        self._writer = None
+
+    def write(self, row):
+        if self._writer is None:
+            # Get all unique keys, with first_column first
+            keys = list(row.keys())
+            if self.first_column in keys:
+                keys.remove(self.first_column)
+                keys.insert(0, self.first_column)
+            self._file = open(self.output_path, 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._file, fieldnames=keys)
+            self._writer.writeheader()
+        self._writer.writerow(row)
+
+    def close(self):
+        """Close the file; returns False if no row was ever written."""
+        if self._file is None:
+            return False
+        self._file.close()
+        print(f"✅ Archivo exportado: {self.output_path}")
+        return True
+
+
+def process_data(data_rows, mapping, matched_export, no_match_export):
+    """Add _ProductId from mapping to each record and write it as it is read.
+
+    Records with a _ProductId go to matched_export and records whose SKU is
+    not in the mapping go to no_match_export (no _ProductId is added).
+
+    Returns:
+        tuple: (total records, matched records, raw SKU of each unmatched record)
+    """
+    rows = iter(data_rows)
+    sample = next(rows, None)
+    if sample is None:
         print("❌ Error: El archivo de datos está vacío")
         sys.exit(1)
 
-    sample = data[0]
     if 'SKU' not in sample:
         print(f"❌ Error: Campo 'SKU' no encontrado en archivo de datos")
         print(f"   Campos disponibles: {list(sample.keys())}")
         sys.exit(1)
 
-    results = []
-    not_matched_list = []
+    total = 0
+    not_matched_skus = []
 
-    for item in data:
-        sku = clean_value(item.get('SKU'))
+    # Locals for the per-row loop; mapping values are always strings
+    mapping_get = mapping.get
+    clean = clean_value
+    write_matched = matched_export.write
+    write_not_matched = no_match_export.write
 
-        # Copy all fields from original record
-        result = item.copy()
+    # Records are not kept: each one is updated in place and written
+    for item in chain((sample,), rows):
+        total += 1
+        product_id = mapping_get(clean(item.get('SKU')))
 
         # Add _ProductId from mapping
-        if sku in mapping:
-            result['_ProductId'] = mapping[sku]
+        if product_id is not None:
+            item['_ProductId'] = product_id
+            if product_id:
+                write_matched(item)
         else:
-            result['_ProductId'] = ''
-            not_matched_list.append(item.copy())
-
-        results.append(result)
-
-    matched = len(results) - len(not_matched_list)
-    return results, matched, not_matched_list
-
-
-def export_csv(data, output_path):
-    """Export data to CSV file."""
-    if not data:
-        print("⚠️ No hay datos para exportar")
-        return
-
-    # Get all unique keys, with _ProductId first
-    keys = list(data[0].keys())
-    if '_ProductId' in keys:
-        keys.remove('_ProductId')
-        keys.insert(0, '_ProductId')
+            not_matched_skus.append(item.get('SKU', 'N/A'))
+            write_not_matched(item)
 
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=keys)
-        writer.writeheader()
-        for item in data:
-            writer.writerow(item)
+    matched = total - len(not_matched_skus)
+    return total, matched, not_matched_skus
 
-    print(f"✅ Archivo exportado: {output_path}")
 
-
-def generate_report(output_path, stats, not_matched_list):
+def generate_report(output_path, stats, not_matched_skus):
     """Generate markdown report with statistics."""
     with open(output_path, 'w', encoding='utf-8') as f:
         f.write("# SKU ProductId Matcher - Reporte\n\n")
@@ -172,12 +234,11 @@ def generate_report(output_path, stats, not_matched_list):
             f.write(f"- `{stats['no_match_file']}` - Registros sin match\n")
         f.write(f"- `{stats['report_file']}` - Este reporte\n\n")
 
-        if not_matched_list:
+        if not_matched_skus:
             f.write("## SKUs sin match\n\n")
             f.write("| # | SKU |\n")
             f.write("|---|-----|\n")
-            for i, item in enumerate(not_matched_list, 1):
-                sku = item.get('SKU', 'N/A')
+            for i, sku in enumerate(not_matched_skus, 1):
                 f.write(f"| {i} | {sku} |\n")
 
     print(f"✅ Reporte generado: {output_path}")
@@ -210,48 +271,41 @@ def main():
     print(f"   Archivo de salida: {args.output_file}")
     print()
 
-    # Load files
-    print("📂 Cargando archivos...")
-    mapping_data = load_file(args.mapping_file)
-    print(f"   ✓ Archivo de mapeo: {len(mapping_data)} registros")
-
-    data = load_file(args.data_file)
-    print(f"   ✓ Archivo de datos: {len(data)} registros")
-    print()
+    # Both paths are checked before anything is read
+    mapping_rows = iter_file(args.mapping_file)
+    data_rows = iter_file(args.data_file)
 
     # Build mapping
     print("🔗 Construyendo mapeo _SKUReferenceCode -> _ProductId...")
-    mapping = build_mapping(mapping_data)
+    mapping, mapping_count = build_mapping(mapping_rows)
+    print(f"   ✓ Archivo de mapeo: {mapping_count} registros")
     print(f"   ✓ {len(mapping)} referencias únicas en mapeo")
     print()
 
-    # Process data
-    print("🔍 Procesando datos...")
-    results, matched, not_matched_list = process_data(data, mapping)
-    not_matched = len(not_matched_list)
+    # Process data, writing matched and not matched records as they are read
+    print("🔍 Procesando datos y exportando resultados...")
+    matched_export = CsvExport(args.output_file, first_column='_ProductId')
+    no_match_export = CsvExport(no_match_file, first_column='_ProductId')
+    total, matched, not_matched_skus = process_data(data_rows, mapping, matched_export, no_match_export)
+    if not matched_export.close():
+        print("⚠️ No hay datos para exportar")
+    no_match_export.close()
+    not_matched = len(not_matched_skus)
+    print(f"   ✓ Archivo de datos: {total} registros")
     print()
 
-    # Export results (only matched records)
-    print("💾 Exportando resultados...")
-    matched_results = [r for r in results if r.get('_ProductId')]
-    export_csv(matched_results, args.output_file)
-
-    # Export not matched records
-    if not_matched_list:
-        export_csv(not_matched_list, no_match_file)
-
     # Calculate match rate
-    match_rate = (matched / len(results)) * 100 if results else 0
+    match_rate = (matched / total) * 100 if total else 0
 
     # Generate report
     stats = {
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
         'mapping_file': args.mapping_file,
         'data_file': args.data_file,
-        'mapping_count': len(mapping_data),
-        'data_count': len(data),
+        'mapping_count': mapping_count,
+        'data_count': total,
         'mapping_refs': len(mapping),
-        'total': len(results),
+        'total': total,
         'matched': matched,
         'not_matched': not_matched,
         'match_rate': match_rate,
@@ -259,14 +313,14 @@ def main():
         'no_match_file': no_match_file,
         'report_file': report_file
     }
-    generate_report(report_file, stats, not_matched_list)
+    generate_report(report_file, stats, not_matched_skus)
 
     # Summary
     print()
     print("=" * 60)
     print("📊 Resumen")
     print("=" * 60)
-    print(f"   Total registros: {len(results)}")
+    print(f"   Total registros: {total}")
     print(f"   ✅ Con _ProductId: {matched}")
     print(f"   ⚠️ Sin match: {not_matched}")
     print(f"   📈 Tasa de match: {match_rate:.1f}%")